@@ -6,6 +6,7 @@ from typing import Optional
 from services.auth import get_current_user_id
 from models.database import AgentConfig, AgentStatus, get_engine, create_session_factory
 from config import get_settings
+from services.agent_runtime import invalidate_agent_cache
 
 router = APIRouter(prefix="/api/agents", tags=["agents"])
 settings = get_settings()
@@ -130,6 +131,7 @@ async def launch_agent(agent_id: str, user_id: str = Depends(get_current_user_id
             "ghost_mode": agent.ghost_mode_enabled,
         }
 
+    invalidate_agent_cache(user_id)
     db.refresh(agent)
     return {
         "message": "Agent launched successfully",
@@ -150,6 +152,7 @@ async def pause_agent(agent_id: str, user_id: str = Depends(get_current_user_id)
         agent.status = AgentStatus.PAUSED
         db.commit()
 
+    invalidate_agent_cache(user_id)
     db.refresh(agent)
     return {"message": "Agent paused", "agent": _agent_to_dict(agent)}
 
@@ -166,6 +169,7 @@ async def stop_agent(agent_id: str, user_id: str = Depends(get_current_user_id),
         agent.status = AgentStatus.STOPPED
         db.commit()
 
+    invalidate_agent_cache(user_id)
     db.refresh(agent)
     return {"message": "Agent stopped", "agent": _agent_to_dict(agent)}
 
@@ -193,6 +197,7 @@ def delete_agent(agent_id: str, user_id: str = Depends(get_current_user_id), db=
         asyncio.create_task(runtime_mgr.stop_agent(agent_id))
     db.delete(agent)
     db.commit()
+    invalidate_agent_cache(user_id)
     return {"message": "Agent deleted"}
 
 
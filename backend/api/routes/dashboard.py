@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, case
 from datetime import datetime, timedelta, timezone
 from services.auth import get_current_user_id
+from services.relationship_graph import get_relationship_graph
 from models.database import AgentAction, AgentConfig, ActionStatus, UserPreference, ContactRelationship, get_engine, create_session_factory
 from config import get_settings
 
@@ -118,6 +119,21 @@ def get_decision_log(
     }
 
 
+@router.get("/briefing")
+def get_briefing_bundle(user_id: str = Depends(get_current_user_id), db=Depends(get_db)):
+    """Everything the voice briefing reads, in one response."""
+    graph = get_relationship_graph(user_id)
+    return {
+        "stats": get_dashboard_stats(user_id=user_id, db=db),
+        "decisions": get_decision_log(
+            user_id=user_id, limit=5, offset=0,
+            status_filter="queued_for_review", channel_filter="all", db=db,
+        ),
+        "tone_shifts": graph.detect_tone_shifts(),
+        "neglected": graph.find_neglected_relationships(),
+    }
+
+
 @router.post("/decisions/{action_id}/feedback")
 def submit_feedback(
     action_id: str,
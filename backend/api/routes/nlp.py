@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from typing import Optional
 
 from services.auth import get_current_user_id
+from services.agent_runtime import invalidate_agent_cache
 from voice.command_dispatch import (
     dispatch_command, detect_language, parse_command,
     CommandType, COMMAND_ROUTE_MAP, _t,
@@ -169,6 +170,7 @@ async def setup_agent_from_nlp(user_id: str, text: str, lang: str) -> str:
         agent.status = "running"
 
         db.commit()
+        invalidate_agent_cache(user_id)
 
         # Build confirmation message
         parts = []
@@ -281,6 +283,14 @@ class NLPBackendAdapter:
             "channels": channels,
         }
 
+    async def get_briefing(self) -> dict:
+        return {
+            "stats": await self.get_stats(),
+            "decisions": await self.get_decisions(limit=5, status_filter="queued_for_review"),
+            "tone_shifts": await self.get_tone_shifts(),
+            "neglected": await self.get_neglected_contacts(),
+        }
+
     async def get_tone_shifts(self) -> list:
         return []
 
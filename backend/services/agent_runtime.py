@@ -36,6 +36,7 @@ On server restart:
 import logging
 import json
 import asyncio
+import time
 from typing import Optional
 from datetime import datetime, timezone, timedelta
 
@@ -810,6 +811,7 @@ class AgentRuntime:
                 db.commit()
         finally:
             db.close()
+        invalidate_agent_cache(self.user_id)
 
     def _persist_graph(self):
         """Save this user's NetworkX graph to DB and Snowflake."""
@@ -959,6 +961,7 @@ class RuntimeManager:
                     # Mark as paused if recovery fails
                     agent_config.status = "paused"
                     db.commit()
+                    invalidate_agent_cache(agent_config.user_id)
 
         finally:
             db.close()
@@ -976,3 +979,43 @@ def get_runtime_manager() -> RuntimeManager:
     if _runtime_manager is None:
         _runtime_manager = RuntimeManager()
     return _runtime_manager
+
+
+# ── Running-agent lookup cache ──
+
+# Running-agent lookups per user (agent_id or None); status changes invalidate
+AGENT_CACHE_TTL = 30.0
+_agent_cache: dict[str, tuple[Optional[str], float]] = {}
+# Bumped on every invalidation so a lookup already in flight can't store a stale result
+_agent_cache_gen: dict[str, int] = {}
+
+
+def _running_agent_id(user_id: str) -> Optional[str]:
+    db = SessionLocal()
+    try:
+        row = db.query(AgentConfig.id).filter(
+            AgentConfig.user_id == user_id,
+            AgentConfig.status == "running"
+        ).first()
+        return row.id if row else None
+    finally:
+        db.close()
+
+
+async def cached_running_agent_id(user_id: str) -> Optional[str]:
+    """The user's running agent id (or None), cached for AGENT_CACHE_TTL seconds."""
+    now = time.monotonic()
+    hit = _agent_cache.get(user_id)
+    if hit is not None and now - hit[1] < AGENT_CACHE_TTL:
+        return hit[0]
+    gen = _agent_cache_gen.get(user_id, 0)
+    agent_id = await asyncio.to_thread(_running_agent_id, user_id)
+    if _agent_cache_gen.get(user_id, 0) == gen:
+        _agent_cache[user_id] = (agent_id, now)
+    return agent_id
+
+
+def invalidate_agent_cache(user_id: str):
+    """Drop the cached running agent for a user after its status changes."""
+    _agent_cache.pop(user_id, None)
+    _agent_cache_gen[user_id] = _agent_cache_gen.get(user_id, 0) + 1
@@ -11,6 +11,9 @@ from config import get_settings
 
 logger = logging.getLogger("kairo.tts")
 
+# ffmpeg stdout read size: 100 ms of 24 kHz mono s16le PCM
+PCM_READ_SIZE = 4800
+
 settings = get_settings()
 
 VOICES = {
@@ -73,50 +76,73 @@ try:
 
             try:
                 communicate = edge_tts.Communicate(self._text, self._tts_service.voice)
-                audio_buffer = io.BytesIO()
-
-                async for chunk in communicate.stream():
-                    if chunk["type"] == "audio":
-                        audio_buffer.write(chunk["data"])
-
-                audio_data = audio_buffer.getvalue()
-                logger.info(f"EdgeTTS audio data: {len(audio_data)} bytes")
-                if not audio_data:
-                    logger.warning("EdgeTTS returned empty audio")
-                    return
 
-                # Edge TTS returns MP3 — decode to raw PCM via ffmpeg
+                # Edge TTS returns MP3 — decode to raw PCM via ffmpeg, feeding it
+                # chunks as they arrive so playback starts before synthesis ends
                 proc = await asyncio.create_subprocess_exec(
-                    "ffmpeg", "-i", "pipe:0",
+                    "ffmpeg", "-f", "mp3", "-i", "pipe:0",
                     "-f", "s16le", "-ar", "24000", "-ac", "1",
+                    "-flush_packets", "1",
                     "pipe:1",
                     stdin=asyncio.subprocess.PIPE,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                 )
-                pcm_data, stderr = await proc.communicate(audio_data)
+
+                async def _feed_mp3() -> int:
+                    mp3_bytes = 0
+                    try:
+                        async for chunk in communicate.stream():
+                            if chunk["type"] == "audio":
+                                proc.stdin.write(chunk["data"])
+                                mp3_bytes += len(chunk["data"])
+                                await proc.stdin.drain()
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass  # ffmpeg exited early; its return code reports why
+                    finally:
+                        proc.stdin.close()
+                    return mp3_bytes
+
+                feeder = asyncio.create_task(_feed_mp3())
+                stderr_reader = asyncio.create_task(proc.stderr.read())
+                pcm_bytes = 0
+                try:
+                    while True:
+                        pcm_chunk = await proc.stdout.read(PCM_READ_SIZE)
+                        if not pcm_chunk:
+                            break
+                        if not pcm_bytes:
+                            # Initialize emitter with raw PCM format on the first chunk
+                            output.initialize(
+                                request_id=str(uuid.uuid4()),
+                                sample_rate=24000,
+                                num_channels=1,
+                                mime_type="audio/pcm",
+                                stream=False,
+                            )
+                        output.push(pcm_chunk)
+                        pcm_bytes += len(pcm_chunk)
+                    mp3_bytes = await feeder
+                    await proc.wait()
+                    stderr = await stderr_reader
+                finally:
+                    if proc.returncode is None:
+                        proc.kill()
+                    feeder.cancel()
+                    stderr_reader.cancel()
+
+                logger.info(f"EdgeTTS audio data: {mp3_bytes} bytes")
+                if not mp3_bytes:
+                    logger.warning("EdgeTTS returned empty audio")
+                    return
                 if proc.returncode != 0:
                     logger.error(f"ffmpeg error (rc={proc.returncode}): {stderr.decode()[:300]}")
                     return
-
-                logger.info(f"EdgeTTS PCM data: {len(pcm_data)} bytes")
-                if len(pcm_data) == 0:
+                if not pcm_bytes:
                     logger.warning("ffmpeg produced empty PCM output")
                     return
 
-                # Initialize emitter with raw PCM format
-                request_id = str(uuid.uuid4())
-                output.initialize(
-                    request_id=request_id,
-                    sample_rate=24000,
-                    num_channels=1,
-                    mime_type="audio/pcm",
-                    stream=False,
-                )
-
-                # Push raw PCM bytes directly (emitter handles framing for non-stream)
-                output.push(pcm_data)
-                logger.info(f"EdgeTTS audio pushed successfully ({len(pcm_data)} bytes)")
+                logger.info(f"EdgeTTS audio pushed successfully ({pcm_bytes} bytes)")
 
             except FileNotFoundError:
                 logger.error("ffmpeg not found — required for Edge TTS audio decoding")
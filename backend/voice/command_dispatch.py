@@ -3,11 +3,15 @@ Shared command parsing and dispatch module.
 Used by both the LiveKit voice agent and the NLP HTTP endpoint.
 """
 
+import asyncio
 import random
 import re
 import logging
-from datetime import datetime
-from typing import Optional
+import time
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import Callable, Optional
 
 logger = logging.getLogger("kairo.commands")
 
@@ -17,7 +21,8 @@ logger = logging.getLogger("kairo.commands")
 # ──────────────────────────────────────────
 
 _DEVANAGARI_RE = re.compile(r"[\u0900-\u097F]")
-_HINDI_MARKERS = {
+_has_devanagari = _DEVANAGARI_RE.search
+_HINDI_MARKERS = frozenset({
     "kya", "hai", "karo", "bolo", "mera", "meri", "aaj", "kal", "abhi",
     "haan", "nahi", "kaise", "kaisa", "kaisi", "raha", "rahi",
     "tha", "thi", "wala", "wali", "yaar", "bhai", "didi", "accha",
@@ -25,14 +30,21 @@ _HINDI_MARKERS = {
     "hoga", "hogi", "maine", "tumne", "usne", "kisko", "kidhar",
     "kab", "kyun", "hafta", "mahina", "saal", "suprabhat", "namaste",
     "ko", "ka", "ki", "ke", "mein",
-}
+})
 
 
 def detect_language(text: str) -> str:
     """Detect whether input is English, Hindi, or Hinglish."""
-    if _DEVANAGARI_RE.search(text):
+    return _detect_language(text.strip().lower())
+
+
+@lru_cache(maxsize=1024)
+def _detect_language(text: str) -> str:
+    # Keyed on the normalized utterance — short commands repeat a lot in voice.
+    # ASCII text can't contain Devanagari, and isascii() is a flag check on str.
+    if not text.isascii() and _has_devanagari(text):
         return "hi"
-    words = set(text.lower().split())
+    words = set(text.split())
     hindi_count = len(words & _HINDI_MARKERS)
     ratio = hindi_count / max(len(words), 1)
     if ratio > 0.4:
@@ -42,36 +54,68 @@ def detect_language(text: str) -> str:
     return "en"
 
 
+# Detected language -> Edge TTS language key; anything else speaks English
+_TTS_LANGUAGES = {"hi": "hi", "hinglish": "en-IN"}
+
+
 def tts_language_for(detected: str) -> str:
     """Map detected language to Edge TTS language key."""
-    if detected == "hi":
-        return "hi"
-    if detected == "hinglish":
-        return "en-IN"
-    return "en"
+    return _TTS_LANGUAGES.get(detected, "en")
+
+
+# Languages answered with the Hindi variant of a reply
+_HI_LANGS = frozenset({"hi", "hinglish"})
 
 
 def _t(lang: str, en: str, hi: str) -> str:
     """Pick string by language. Hinglish uses Hindi variant."""
-    if lang in ("hi", "hinglish"):
+    if lang in _HI_LANGS:
         return hi
     return en
 
 
-def _time_greeting(lang: str = "en") -> str:
+def _plural(n: int, singular: str, plural: str) -> str:
+    """Pick the singular or plural noun for a count."""
+    return singular if n == 1 else plural
+
+
+# (English, Hindi) greeting per hour bucket: morning, afternoon, evening
+_GREETING_LUT = (
+    ("Good morning", "Suprabhat"),
+    ("Good afternoon", "Namaskar"),
+    ("Good evening", "Shubh sandhya"),
+)
+
+
+# (bucket, monotonic expiry) for the current local time, refreshed once a minute
+_hour_bucket_cache: tuple[int, float] = (0, 0.0)
+
+
+def _hour_bucket(hour: Optional[int] = None) -> int:
+    """Index into _GREETING_LUT: 0 before noon, 1 before 5pm, 2 after."""
+    global _hour_bucket_cache
+    if hour is not None:
+        return (hour >= 12) + (hour >= 17)
+    now = time.monotonic()
+    bucket, expires = _hour_bucket_cache
+    if now < expires:
+        return bucket
+    hour = time.localtime().tm_hour
+    bucket = (hour >= 12) + (hour >= 17)
+    _hour_bucket_cache = (bucket, now + 60.0)
+    return bucket
+
+
+def _time_greeting(lang: str = "en", bucket: Optional[int] = None) -> str:
     """Return a time-appropriate greeting."""
-    hour = datetime.now().hour
-    if hour < 12:
-        return "Good morning" if lang == "en" else "Suprabhat"
-    elif hour < 17:
-        return "Good afternoon" if lang == "en" else "Namaskar"
-    else:
-        return "Good evening" if lang == "en" else "Shubh sandhya"
+    if bucket is None:
+        bucket = _hour_bucket()
+    return _GREETING_LUT[bucket][lang != "en"]
 
 
 def _pick(lang: str, en_variants: list[str], hi_variants: list[str]) -> str:
     """Pick a random response variant by language."""
-    if lang in ("hi", "hinglish"):
+    if lang in _HI_LANGS:
         return random.choice(hi_variants)
     return random.choice(en_variants)
 
@@ -130,11 +174,44 @@ COMMAND_ROUTE_MAP = {
 # COMMAND PATTERN MATCHING
 # ──────────────────────────────────────────
 
-_COMMAND_PATTERNS: list[tuple[re.Pattern, str, Optional[callable]]] = []
+# Literal the "<contact> ko ..." patterns require. They open with (.+?), so a
+# failed search retries from every offset — check for the literal first.
+# Table entries opt in by naming it as their fourth element.
+_KO_GUARD = re.compile(r"(?i)\sko\s")
+
+
+def _trie_alternation(keywords: list[str]) -> str:
+    """Regex for a set of literal keywords with shared prefixes factored out."""
+    trie: dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = {}
 
+    def _emit(node: dict) -> str:
+        alts = [re.escape(ch) + _emit(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
 
-def _build_patterns():
-    """Build the command pattern table. Called once at module load."""
+    return _emit(trie)
+
+
+def _keywords(*phrases: str) -> str:
+    """Pattern matching any of the literal phrases at a word boundary.
+
+    Shared prefixes are factored out so a miss fails fast at each position.
+    """
+    return r"(?i)\b(" + _trie_alternation(list(phrases)) + ")"
+
+
+def _build_patterns() -> tuple[tuple[Callable, str, Optional[Callable], Optional[Callable]], ...]:
+    """Build the command pattern table. Called once at module load.
+
+    Entries hold bound ``search`` methods, for the pattern and its guard.
+    """
     patterns = [
         (r"(?i)\b(what did i miss|kya miss hua|missed kya|kuch miss|what.?s new|catch me up|kya hua jab)", CommandType.MISSED_SUMMARY, None),
         (r"(?i)\b(aaj ka schedule|today.?s schedule|what.?s my schedule|my schedule|aaj kya hai|today.?s plan|aaj ka plan|calendar today|meetings today|aaj ki meetings)", CommandType.SCHEDULE_TODAY, None),
@@ -142,22 +219,22 @@ def _build_patterns():
         (r"(?i)\b(weekly (summary|report)|hafta kaisa raha|week kaisa tha|is hafte ka|this week.?s (summary|report)|pichle hafte|last week)", CommandType.WEEKLY_SUMMARY, None),
         (r"(?i)(move|shift|reschedule|postpone|push|delay)\s+(my\s+)?(.+?)\s*(meeting|call|sync)", CommandType.RESCHEDULE, lambda m: {"description": m.group(3).strip()}),
         (r"(?i)(reply to|respond to|draft.*reply.*to)\s+(.+)", CommandType.DRAFT_REPLY, lambda m: {"contact": m.group(2).strip()}),
-        (r"(?i)(.+?)\s+ko\s+(reply|jawab)\s+(kar|do|de|bhej)", CommandType.DRAFT_REPLY, lambda m: {"contact": m.group(1).strip()}),
+        (r"(?i)(.+?)\s+ko\s+(reply|jawab)\s+(kar|do|de|bhej)", CommandType.DRAFT_REPLY, lambda m: {"contact": m.group(1).strip()}, _KO_GUARD),
         (r"(?i)(send|text|message)\s+[\"']?(.+?)[\"']?\s+(to)\s+(.+)", CommandType.SEND_MESSAGE, lambda m: {"message": m.group(2).strip(), "contact": m.group(4).strip()}),
-        (r"(?i)(.+?)\s+ko\s+(bhej|send)\s*[:\-]?\s*(.+)", CommandType.SEND_MESSAGE, lambda m: {"contact": m.group(1).strip(), "message": m.group(3).strip()}),
+        (r"(?i)(.+?)\s+ko\s+(bhej|send)\s*[:\-]?\s*(.+)", CommandType.SEND_MESSAGE, lambda m: {"contact": m.group(1).strip(), "message": m.group(3).strip()}, _KO_GUARD),
         (r"(?i)\b(morning briefing|briefing|give me.*briefing|aaj ka briefing|briefing de|briefing sunao)", CommandType.BRIEFING, None),
         (r"(?i)\b(ghost (summary|debrief|report)|what did ghost.*(do|handle)|ghost ne kya kiya|ghost mode summary)", CommandType.GHOST_DEBRIEF, None),
-        (r"(?i)\b(my commitments|what did i promise|pending promises|kya promise kiya|meri commitments|overdue)", CommandType.COMMITMENTS, None),
+        (_keywords("my commitments", "what did i promise", "pending promises", "kya promise kiya", "meri commitments", "overdue"), CommandType.COMMITMENTS, None),
         (r"(?i)\b(commitment (status|score)|reliability|kitna nibhaya)", CommandType.COMMITMENT_STATUS, None),
         (r"(?i)(delegate|hand off|pass|assign)\s+(.+?)\s+to\s+(\w+)", CommandType.DELEGATE_TASK, lambda m: {"task": m.group(2), "contact": m.group(3)}),
         (r"(?i)(who should|best person|kisko doon|kisko assign)\s+(.+)", CommandType.DELEGATE_TASK, lambda m: {"task": m.group(2)}),
-        (r"(?i)\b(burnout|wellness|stress level|am i burning out|kitna stress hai|workload kaisa)", CommandType.BURNOUT_CHECK, None),
-        (r"(?i)\b(productivity tips|when am i most productive|peak hours|best time to work|kab kaam karna chahiye)", CommandType.PRODUCTIVITY_TIPS, None),
-        (r"(?i)\b(what if|replay|counterfactual|kya hota agar|what would have happened|decision replay)", CommandType.DECISION_REPLAY, None),
+        (_keywords("burnout", "wellness", "stress level", "am i burning out", "kitna stress hai", "workload kaisa"), CommandType.BURNOUT_CHECK, None),
+        (_keywords("productivity tips", "when am i most productive", "peak hours", "best time to work", "kab kaam karna chahiye"), CommandType.PRODUCTIVITY_TIPS, None),
+        (_keywords("what if", "replay", "counterfactual", "kya hota agar", "what would have happened", "decision replay"), CommandType.DECISION_REPLAY, None),
         (r"(?i)\b(flow (status|state)|am i in flow|kya focus mode hai)", CommandType.FLOW_STATUS, None),
-        (r"(?i)\b(start flow|enter flow|focus mode on|flow mode|focus karo|disturb mat karo)", CommandType.FLOW_START, None),
-        (r"(?i)\b(end flow|exit flow|surface|flow band|focus mode off)", CommandType.FLOW_END, None),
-        (r"(?i)\b(flow debrief|what did i miss in flow|flow ke baad kya hua)", CommandType.FLOW_DEBRIEF, None),
+        (_keywords("start flow", "enter flow", "focus mode on", "flow mode", "focus karo", "disturb mat karo"), CommandType.FLOW_START, None),
+        (_keywords("end flow", "exit flow", "surface", "flow band", "focus mode off"), CommandType.FLOW_END, None),
+        (_keywords("flow debrief", "what did i miss in flow", "flow ke baad kya hua"), CommandType.FLOW_DEBRIEF, None),
 
         # Agent setup — natural language agent creation
         (r"(?i)(create|setup|set up|start|launch|build|make)\s+(my\s+)?(agent|kairo|assistant)", CommandType.SETUP_AGENT, None),
@@ -168,11 +245,13 @@ def _build_patterns():
         (r"(?i)(vip|important|priority).*(contact|person|people).*(?:is|are|:)\s*(.+)", CommandType.SETUP_AGENT, lambda m: {"vip_contacts": [c.strip() for c in m.group(3).split(",")]}),
         (r"(?i)(?:except|but not|always escalate|never auto.?reply to)\s+(.+)", CommandType.SETUP_AGENT, lambda m: {"vip_contacts": [c.strip() for c in m.group(1).split(",")]}),
     ]
-    for pattern_str, cmd_type, extractor in patterns:
-        _COMMAND_PATTERNS.append((re.compile(pattern_str), cmd_type, extractor))
+    table = []
+    for pattern_str, cmd_type, extractor, *guard in patterns:
+        table.append((re.compile(pattern_str).search, cmd_type, extractor, guard[0].search if guard else None))
+    return tuple(table)
 
 
-_build_patterns()
+_COMMAND_PATTERNS = _build_patterns()
 
 
 def parse_command(text: str) -> tuple[str, dict]:
@@ -181,13 +260,24 @@ def parse_command(text: str) -> tuple[str, dict]:
     Returns (CommandType, extracted_params).
     Falls back to GENERAL for unrecognized input.
     """
-    text_clean = text.strip()
-    for pattern, cmd_type, extractor in _COMMAND_PATTERNS:
-        match = pattern.search(text_clean)
+    cmd_type, frozen = _parse_command(text.strip())
+    return cmd_type, {k: list(v) if isinstance(v, tuple) else v for k, v in frozen}
+
+
+@lru_cache(maxsize=2048)
+def _parse_command(text_clean: str) -> tuple[str, tuple]:
+    # Params are frozen (lists become tuples) so cached results stay immutable;
+    # case is kept in the key because extracted names and messages use it.
+    for search, cmd_type, extractor, guard in _COMMAND_PATTERNS:
+        if guard is not None and guard(text_clean) is None:
+            continue
+        match = search(text_clean)
         if match:
             params = extractor(match) if extractor else {}
-            return cmd_type, params
-    return CommandType.GENERAL, {"query": text_clean}
+            return cmd_type, tuple(
+                (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+            )
+    return CommandType.GENERAL, (("query", text_clean),)
 
 
 # ──────────────────────────────────────────
@@ -210,26 +300,32 @@ async def handle_missed_summary(client, lang: str) -> str:
                     "Sab smooth raha — koi urgent cheez nahi aayi.",
                     "Aapne kuch miss nahi kiya. Sab sorted hai.",
                 ])
-        executed = [a for a in actions if a.get("status") == "executed"]
-        queued = [a for a in actions if a.get("status") == "queued_for_review"]
+        # One pass: status counts plus up to 3 highlights from the 5 most recent
+        executed = queued = 0
+        highlights = []
+        for i, a in enumerate(actions):
+            status = a.get("status")
+            if status == "executed":
+                executed += 1
+            elif status == "queued_for_review":
+                queued += 1
+            if i < 5 and len(highlights) < 3:
+                summary = a.get("action_taken", "")
+                if summary:
+                    highlights.append(summary)
         parts = []
         if executed:
             parts.append(_t(lang,
-                            en=f"I handled {len(executed)} item{'s' if len(executed) != 1 else ''} automatically",
-                            hi=f"Maine {len(executed)} kaam automatically handle kiye"))
+                            en=f"I handled {executed} {_plural(executed, 'item', 'items')} automatically",
+                            hi=f"Maine {executed} kaam automatically handle kiye"))
         if queued:
             parts.append(_t(lang,
-                            en=f"{len(queued)} item{'s' if len(queued) != 1 else ''} waiting for your review",
-                            hi=f"{len(queued)} cheezein aapke review ka wait kar rahi hain"))
-        highlights = []
-        for a in actions[:5]:
-            summary = a.get("action_taken", "")
-            if summary:
-                highlights.append(summary)
+                            en=f"{queued} {_plural(queued, 'item', 'items')} waiting for your review",
+                            hi=f"{queued} cheezein aapke review ka wait kar rahi hain"))
         result = ". ".join(parts) + "."
         if highlights:
             result += " " + _t(lang, en="Key items: ", hi="Important: ")
-            result += "; ".join(highlights[:3]) + "."
+            result += "; ".join(highlights) + "."
         return result
     except Exception as e:
         logger.error(f"handle_missed_summary failed: {e}")
@@ -246,8 +342,14 @@ async def handle_missed_summary(client, lang: str) -> str:
 
 async def handle_schedule_today(client, lang: str) -> str:
     try:
-        stats = await client.get_stats()
-        decisions = await client.get_decisions(limit=20, status_filter="all")
+        stats, decisions = await asyncio.gather(
+            client.get_stats(),
+            client.get_decisions(limit=20, status_filter="all"),
+            return_exceptions=True,
+        )
+        for result in (stats, decisions):
+            if isinstance(result, Exception):
+                raise result
         actions = decisions.get("actions", [])
         calendar_items = [a for a in actions if a.get("channel") == "calendar"]
         pending = [a for a in actions if a.get("status") == "queued_for_review"]
@@ -260,8 +362,8 @@ async def handle_schedule_today(client, lang: str) -> str:
         if meetings_today > 0 or calendar_items:
             count = meetings_today or len(calendar_items)
             parts.append(_t(lang,
-                en=f"You have {count} meeting{'s' if count != 1 else ''} today",
-                hi=f"Aaj {count} meeting{'s' if count != 1 else ''} hain"))
+                en=f"You have {count} {_plural(count, 'meeting', 'meetings')} today",
+                hi=f"Aaj {count} {_plural(count, 'meeting', 'meetings')} hain"))
             for item in calendar_items[:3]:
                 desc = item.get("action_taken", "meeting")
                 parts.append(f"  - {desc}")
@@ -272,7 +374,7 @@ async def handle_schedule_today(client, lang: str) -> str:
 
         if pending:
             parts.append(_t(lang,
-                en=f"{len(pending)} item{'s' if len(pending) != 1 else ''} waiting for your review",
+                en=f"{len(pending)} {_plural(len(pending), 'item', 'items')} waiting for your review",
                 hi=f"{len(pending)} cheezein review ke liye pending hain"))
 
         if auto_handled:
@@ -366,7 +468,7 @@ async def handle_weekly_summary(client, lang: str) -> str:
             headline = ""
             channels = {}
 
-        if lang == "hi" or lang == "hinglish":
+        if lang in _HI_LANGS:
             parts = [random.choice([
                 "Is hafte ka summary.",
                 "Chaliye, hafte ka hisaab dekhte hain.",
@@ -377,7 +479,7 @@ async def handle_weekly_summary(client, lang: str) -> str:
             if total_actions > 0:
                 parts.append(f"Total {total_actions} actions liye, {accuracy}% accuracy ke saath.")
             if channels:
-                top = sorted(channels.items(), key=lambda x: x[1], reverse=True)[:3]
+                top = nlargest(3, channels.items(), key=itemgetter(1))
                 ch_str = ", ".join(f"{ch} pe {cnt}" for ch, cnt in top)
                 parts.append(f"Sabse zyada active: {ch_str}.")
             return " ".join(parts)
@@ -392,7 +494,7 @@ async def handle_weekly_summary(client, lang: str) -> str:
             if total_actions > 0:
                 parts.append(f"{total_actions} actions taken at {accuracy}% accuracy.")
             if channels:
-                top = sorted(channels.items(), key=lambda x: x[1], reverse=True)[:3]
+                top = nlargest(3, channels.items(), key=itemgetter(1))
                 ch_str = ", ".join(f"{ch} ({cnt})" for ch, cnt in top)
                 parts.append(f"Most active on {ch_str}.")
             return " ".join(parts)
@@ -454,12 +556,34 @@ async def handle_send_message(client, lang: str, params: dict) -> str:
 
 async def compile_briefing(client, lang: str = "en") -> str:
     sections = []
+    # One round trip for all four sources; if the bundle route fails, fetch them
+    # concurrently so each section can still succeed or fail on its own.
     try:
-        stats = await client.get_stats()
+        bundle = await client.get_briefing()
+        stats, decisions = bundle["stats"], bundle["decisions"]
+        tone_shifts, neglected = bundle["tone_shifts"], bundle["neglected"]
+    except TimeoutError as e:
+        # A backend too slow for the bundle would be as slow for each source —
+        # retrying would double the wait, so report every section as failed.
+        logger.warning(f"Briefing bundle timed out: {e}")
+        stats = decisions = tone_shifts = neglected = e
+    except Exception as e:
+        logger.warning(f"Briefing bundle failed, fetching sources separately: {e}")
+        stats, decisions, tone_shifts, neglected = await asyncio.gather(
+            client.get_stats(),
+            client.get_decisions(limit=5, status_filter="queued_for_review"),
+            client.get_tone_shifts(),
+            client.get_neglected_contacts(),
+            return_exceptions=True,
+        )
+
+    try:
+        if isinstance(stats, Exception):
+            raise stats
         total = stats.get("total_actions", 0)
         auto = stats.get("auto_handled", 0)
         time_hrs = stats.get("time_saved_hours", 0)
-        if lang == "hi" or lang == "hinglish":
+        if lang in _HI_LANGS:
             greeting = _time_greeting("hi")
             sections.append(
                 f"{greeting}! Pichhle 7 dinon mein {total} actions hue, "
@@ -476,17 +600,19 @@ async def compile_briefing(client, lang: str = "en") -> str:
         logger.warning(f"Briefing stats failed: {e}")
 
     try:
-        decisions = await client.get_decisions(limit=5, status_filter="queued_for_review")
+        if isinstance(decisions, Exception):
+            raise decisions
         pending = decisions.get("total", 0)
         if pending > 0:
             sections.append(_t(lang,
-                en=f"You have {pending} item{'s' if pending != 1 else ''} waiting for your review.",
+                en=f"You have {pending} {_plural(pending, 'item', 'items')} waiting for your review.",
                 hi=f"{pending} cheezein aapke review ke liye pending hain."))
     except Exception as e:
         logger.warning(f"Briefing decisions failed: {e}")
 
     try:
-        tone_shifts = await client.get_tone_shifts()
+        if isinstance(tone_shifts, Exception):
+            raise tone_shifts
         if tone_shifts:
             names = [ts.get("contact", "someone") for ts in tone_shifts[:3]]
             sections.append(_t(lang,
@@ -496,7 +622,8 @@ async def compile_briefing(client, lang: str = "en") -> str:
         logger.warning(f"Briefing tone shifts failed: {e}")
 
     try:
-        neglected = await client.get_neglected_contacts()
+        if isinstance(neglected, Exception):
+            raise neglected
         if neglected:
             names = [n.get("contact", "someone") for n in neglected[:3]]
             sections.append(_t(lang,
@@ -506,8 +633,9 @@ async def compile_briefing(client, lang: str = "en") -> str:
         logger.warning(f"Briefing neglected contacts failed: {e}")
 
     if not sections:
-        en_g = _time_greeting("en")
-        hi_g = _time_greeting("hi")
+        bucket = _hour_bucket()
+        en_g = _time_greeting("en", bucket)
+        hi_g = _time_greeting("hi", bucket)
         return _t(lang,
                   en=f"{en_g}! Everything looks calm today. No urgent items.",
                   hi=f"{hi_g}! Aaj sab shaant hai. Koi urgent kaam nahi.")
@@ -520,7 +648,13 @@ async def compile_briefing(client, lang: str = "en") -> str:
 
 async def get_ghost_summary(client, lang: str = "en") -> str:
     try:
-        decisions = await client.get_decisions(limit=50, status_filter="executed")
+        decisions, queued_data = await asyncio.gather(
+            client.get_decisions(limit=50, status_filter="executed"),
+            client.get_decisions(limit=1, status_filter="queued_for_review"),
+            return_exceptions=True,
+        )
+        if isinstance(decisions, Exception):
+            raise decisions
         actions = decisions.get("actions", [])
         if not actions:
             return _t(lang,
@@ -528,34 +662,32 @@ async def get_ghost_summary(client, lang: str = "en") -> str:
                       hi="Ghost mode ne abhi tak koi action nahi liya.")
         by_channel: dict[str, int] = {}
         queued_review = 0
+        vip_count = 0
         for a in actions:
             ch = a.get("channel", "other")
             by_channel[ch] = by_channel.get(ch, 0) + 1
-        try:
-            queued_data = await client.get_decisions(limit=1, status_filter="queued_for_review")
+            if "vip" in (a.get("action_type") or "").lower():
+                vip_count += 1
+        if not isinstance(queued_data, Exception):
             queued_review = queued_data.get("total", 0)
-        except Exception:
-            pass
         total = len(actions)
         breakdown_parts = []
-        for ch, count in sorted(by_channel.items(), key=lambda x: x[1], reverse=True):
+        for ch, count in sorted(by_channel.items(), key=itemgetter(1), reverse=True):
             breakdown_parts.append(f"{count} {ch}")
         breakdown = ", ".join(breakdown_parts)
-        if lang == "hi" or lang == "hinglish":
+        if lang in _HI_LANGS:
             result = f"Ghost mode ne {total} kaam handle kiye: {breakdown}."
             if queued_review > 0:
                 result += f" Aur {queued_review} cheezein aapke review ke liye hain."
-            vip_items = [a for a in actions if "vip" in (a.get("action_type") or "").lower()]
-            if vip_items:
-                result += f" {len(vip_items)} VIP items the jinko special attention mila."
+            if vip_count:
+                result += f" {vip_count} VIP items the jinko special attention mila."
             return result
         else:
             result = f"While ghost mode was active, I handled {total} items: {breakdown}."
             if queued_review > 0:
-                result += f" {queued_review} item{'s' if queued_review != 1 else ''} queued for your review."
-            vip_items = [a for a in actions if "vip" in (a.get("action_type") or "").lower()]
-            if vip_items:
-                result += f" {len(vip_items)} VIP item{'s' if len(vip_items) != 1 else ''} received special handling."
+                result += f" {queued_review} {_plural(queued_review, 'item', 'items')} queued for your review."
+            if vip_count:
+                result += f" {vip_count} VIP {_plural(vip_count, 'item', 'items')} received special handling."
             return result
     except Exception as e:
         logger.error(f"get_ghost_summary failed: {e}")
@@ -570,10 +702,96 @@ async def get_ghost_summary(client, lang: str = "en") -> str:
             ])
 
 
+# ──────────────────────────────────────────
+# SPECULATIVE PREFETCH
+# ──────────────────────────────────────────
+
+# Backend reads each data-backed handler makes — keep the arguments in sync
+# with the handlers above so prefetched responses land on the same cache keys.
+_PREFETCH_PLANS = {
+    CommandType.MISSED_SUMMARY: lambda c: (c.get_decisions(limit=15, status_filter="all"),),
+    CommandType.SCHEDULE_TODAY: lambda c: (c.get_stats(), c.get_decisions(limit=20, status_filter="all")),
+    CommandType.GHOST_TOGGLE: lambda c: (c.get_agents(),),
+    CommandType.WEEKLY_SUMMARY: lambda c: (c.get_weekly_report(),),
+    CommandType.BRIEFING: lambda c: (c.get_briefing(),),
+    CommandType.GHOST_DEBRIEF: lambda c: (
+        c.get_decisions(limit=50, status_filter="executed"),
+        c.get_decisions(limit=1, status_filter="queued_for_review"),
+    ),
+}
+
+
+async def prefetch_command(client, cmd_type: str) -> None:
+    """
+    Warm the client's GET cache with the reads cmd_type's handler will make.
+    Used on final transcripts ahead of dispatch; a dispatch that arrives while
+    these are in flight waits for them. Failures are ignored here — the
+    dispatch reports them.
+    """
+    plan = _PREFETCH_PLANS.get(cmd_type)
+    if plan is not None:
+        await asyncio.gather(*plan(client), return_exceptions=True)
+
+
 # ──────────────────────────────────────────
 # COMMAND DISPATCHER
 # ──────────────────────────────────────────
 
+# Commands answered from backend data: cmd_type -> (client, lang, params) -> coroutine
+_HANDLERS = {
+    CommandType.MISSED_SUMMARY: lambda client, lang, params: handle_missed_summary(client, lang),
+    CommandType.SCHEDULE_TODAY: lambda client, lang, params: handle_schedule_today(client, lang),
+    CommandType.GHOST_TOGGLE: lambda client, lang, params: handle_ghost_toggle(client, lang),
+    CommandType.WEEKLY_SUMMARY: lambda client, lang, params: handle_weekly_summary(client, lang),
+    CommandType.RESCHEDULE: handle_reschedule,
+    CommandType.DRAFT_REPLY: handle_draft_reply,
+    CommandType.SEND_MESSAGE: handle_send_message,
+    CommandType.BRIEFING: lambda client, lang, params: compile_briefing(client, lang),
+    CommandType.GHOST_DEBRIEF: lambda client, lang, params: get_ghost_summary(client, lang),
+}
+
+
+# Fixed bilingual replies for commands that point at a dashboard page: cmd_type -> (en, hi)
+_STATIC_RESPONSES = {
+    CommandType.COMMITMENTS: (
+        "Let me check your commitments. You can see the full list on your dashboard.",
+        "Main aapki commitments check kar raha hoon. Dashboard pe poori list hai.",
+    ),
+    CommandType.COMMITMENT_STATUS: (
+        "Checking your commitment reliability score. Head to the Commitments page for details.",
+        "Aapka commitment score check kar raha hoon. Details ke liye Commitments page dekhein.",
+    ),
+    CommandType.BURNOUT_CHECK: (
+        "Analyzing your burnout risk. Check the Wellness page for your full report with interventions.",
+        "Aapka burnout risk analyze kar raha hoon. Wellness page pe poori report hai interventions ke saath.",
+    ),
+    CommandType.PRODUCTIVITY_TIPS: (
+        "Your peak productivity is typically mid-morning. Check the Wellness page for your full heatmap.",
+        "Aapki sabse zyada productivity subah hoti hai. Wellness page pe poora heatmap hai.",
+    ),
+    CommandType.DECISION_REPLAY: (
+        "I can replay your recent decisions. Check the Decision Replay page for what-if analysis.",
+        "Main aapke recent decisions ka replay kar sakta hoon. Decision Replay page pe what-if analysis hai.",
+    ),
+    CommandType.FLOW_STATUS: (
+        "Checking your flow state. Visit the Flow Guardian page for real-time status.",
+        "Aapka flow state check kar raha hoon. Flow Guardian page pe real-time status hai.",
+    ),
+    CommandType.FLOW_START: (
+        "Activating flow protection. I'll hold all non-urgent messages and auto-respond for you.",
+        "Flow protection chalu kar raha hoon. Sab non-urgent messages hold karunga aur auto-respond karunga.",
+    ),
+    CommandType.FLOW_END: (
+        "Ending flow session. Preparing your debrief with everything I held.",
+        "Flow session khatam. Debrief ready kar raha hoon jo maine hold kiya tha usme se.",
+    ),
+    CommandType.FLOW_DEBRIEF: (
+        "Here's your flow debrief. Check the Flow Guardian page for the full summary of held messages.",
+        "Yeh raha aapka flow debrief. Flow Guardian page pe held messages ka poora summary hai.",
+    ),
+}
+
+
 async def dispatch_command(client, text: str, lang: str) -> tuple[Optional[str], str]:
     """
     Parse user text, dispatch to the correct handler.
@@ -582,33 +800,15 @@ async def dispatch_command(client, text: str, lang: str) -> tuple[Optional[str],
     """
     cmd_type, params = parse_command(text)
 
-    if cmd_type == CommandType.MISSED_SUMMARY:
-        return await handle_missed_summary(client, lang), cmd_type
-    elif cmd_type == CommandType.SCHEDULE_TODAY:
-        return await handle_schedule_today(client, lang), cmd_type
-    elif cmd_type == CommandType.GHOST_TOGGLE:
-        return await handle_ghost_toggle(client, lang), cmd_type
-    elif cmd_type == CommandType.WEEKLY_SUMMARY:
-        return await handle_weekly_summary(client, lang), cmd_type
-    elif cmd_type == CommandType.RESCHEDULE:
-        return await handle_reschedule(client, lang, params), cmd_type
-    elif cmd_type == CommandType.DRAFT_REPLY:
-        return await handle_draft_reply(client, lang, params), cmd_type
-    elif cmd_type == CommandType.SEND_MESSAGE:
-        return await handle_send_message(client, lang, params), cmd_type
-    elif cmd_type == CommandType.BRIEFING:
-        return await compile_briefing(client, lang), cmd_type
-    elif cmd_type == CommandType.GHOST_DEBRIEF:
-        return await get_ghost_summary(client, lang), cmd_type
-    elif cmd_type == CommandType.COMMITMENTS:
-        return _t(lang,
-                  en="Let me check your commitments. You can see the full list on your dashboard.",
-                  hi="Main aapki commitments check kar raha hoon. Dashboard pe poori list hai."), cmd_type
-    elif cmd_type == CommandType.COMMITMENT_STATUS:
-        return _t(lang,
-                  en="Checking your commitment reliability score. Head to the Commitments page for details.",
-                  hi="Aapka commitment score check kar raha hoon. Details ke liye Commitments page dekhein."), cmd_type
-    elif cmd_type == CommandType.DELEGATE_TASK:
+    handler = _HANDLERS.get(cmd_type)
+    if handler is not None:
+        return await handler(client, lang, params), cmd_type
+
+    static = _STATIC_RESPONSES.get(cmd_type)
+    if static is not None:
+        return _t(lang, *static), cmd_type
+
+    if cmd_type == CommandType.DELEGATE_TASK:
         task = params.get("task", "")
         contact = params.get("contact", "")
         if contact:
@@ -618,34 +818,6 @@ async def dispatch_command(client, text: str, lang: str) -> tuple[Optional[str],
         return _t(lang,
                   en=f"I'll find the best person for '{task}' based on expertise and availability.",
                   hi=f"Main '{task}' ke liye best person dhundh raha hoon expertise aur availability ke basis pe."), cmd_type
-    elif cmd_type == CommandType.BURNOUT_CHECK:
-        return _t(lang,
-                  en="Analyzing your burnout risk. Check the Wellness page for your full report with interventions.",
-                  hi="Aapka burnout risk analyze kar raha hoon. Wellness page pe poori report hai interventions ke saath."), cmd_type
-    elif cmd_type == CommandType.PRODUCTIVITY_TIPS:
-        return _t(lang,
-                  en="Your peak productivity is typically mid-morning. Check the Wellness page for your full heatmap.",
-                  hi="Aapki sabse zyada productivity subah hoti hai. Wellness page pe poora heatmap hai."), cmd_type
-    elif cmd_type == CommandType.DECISION_REPLAY:
-        return _t(lang,
-                  en="I can replay your recent decisions. Check the Decision Replay page for what-if analysis.",
-                  hi="Main aapke recent decisions ka replay kar sakta hoon. Decision Replay page pe what-if analysis hai."), cmd_type
-    elif cmd_type == CommandType.FLOW_STATUS:
-        return _t(lang,
-                  en="Checking your flow state. Visit the Flow Guardian page for real-time status.",
-                  hi="Aapka flow state check kar raha hoon. Flow Guardian page pe real-time status hai."), cmd_type
-    elif cmd_type == CommandType.FLOW_START:
-        return _t(lang,
-                  en="Activating flow protection. I'll hold all non-urgent messages and auto-respond for you.",
-                  hi="Flow protection chalu kar raha hoon. Sab non-urgent messages hold karunga aur auto-respond karunga."), cmd_type
-    elif cmd_type == CommandType.FLOW_END:
-        return _t(lang,
-                  en="Ending flow session. Preparing your debrief with everything I held.",
-                  hi="Flow session khatam. Debrief ready kar raha hoon jo maine hold kiya tha usme se."), cmd_type
-    elif cmd_type == CommandType.FLOW_DEBRIEF:
-        return _t(lang,
-                  en="Here's your flow debrief. Check the Flow Guardian page for the full summary of held messages.",
-                  hi="Yeh raha aapka flow debrief. Flow Guardian page pe held messages ka poora summary hai."), cmd_type
     elif cmd_type == CommandType.SETUP_AGENT:
         # Agent setup is handled specially by the NLP route — return params for it
         return None, cmd_type
@@ -8,20 +8,35 @@ over HTTP (httpx) so it stays decoupled from the main server.
 
 import asyncio
 import logging
-import json
 import os
-from datetime import datetime
-from typing import Optional
+import re
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
 
 import httpx
+import orjson
 
 from config import get_settings
 from voice.command_dispatch import (
     CommandType, parse_command, dispatch_command,
     detect_language, tts_language_for, compile_briefing,
-    get_ghost_summary, _t,
+    get_ghost_summary, prefetch_command, _hour_bucket, _time_greeting,
+    _STATIC_RESPONSES, _HI_LANGS, _t,
 )
 
+# Session-side LiveKit imports, resolved once at module load. Optional so the
+# command pipeline can still be tested standalone without LiveKit installed.
+try:
+    from livekit.agents import Agent, AgentSession
+    from services.edge_tts_service import EdgeTTSService
+except ImportError:
+    Agent = AgentSession = EdgeTTSService = None
+
 settings = get_settings()
 logger = logging.getLogger("kairo.voice")
 
@@ -31,12 +46,59 @@ logger = logging.getLogger("kairo.voice")
 
 BACKEND_URL = os.environ.get("BACKEND_URL", f"http://localhost:{os.environ.get('PORT', '8000')}")
 
-# Cached plugin instances — loaded once on main thread, reused in job threads.
+# Handlers within one voice turn (schedule, weekly summary, briefing) re-read the
+# same dashboard endpoints; serve repeats from memory for this many seconds.
+GET_CACHE_TTL = 5.0
+
+# Endpoints that change more slowly than live stats keep their cache longer
+GET_CACHE_TTLS = {
+    "/api/agents/": 60.0,
+    "/api/dashboard/weekly-report": 300.0,
+    "/api/relationships/tone-shifts": 15.0,
+}
+
+# The LLM's stats tool summarizes trends, so it accepts older stats than the
+# command handlers do; writes still clear the cache.
+TOOL_STATS_MAX_AGE = 60.0
+
+# Pending speech / data-packet events per session before the oldest is dropped
+EVENT_QUEUE_SIZE = 32
+
+# Pending outbound transcripts per session before the oldest is dropped
+TRANSCRIPT_QUEUE_SIZE = 256
+
+
+
+@dataclass(frozen=True, slots=True)
+class PluginBundle:
+    """LiveKit plugin modules and the Silero VAD, shared by every session."""
+    vad: Any
+    anthropic: Any
+    deepgram: Any
+    openai: Any
+
+
+# Loaded once on the main thread, reused in job threads.
 # LiveKit plugins must be imported/registered on the main thread.
-_cached_vad = None
-_lk_anthropic = None
-_lk_deepgram = None
-_lk_openai = None
+_PLUGINS: Optional[PluginBundle] = None
+
+
+def load_plugins() -> PluginBundle:
+    """Import and register the LiveKit plugins. Must be called on the main thread."""
+    global _PLUGINS
+    if _PLUGINS is None:
+        from livekit.plugins import silero
+        from livekit.plugins import anthropic as lk_anthropic
+        from livekit.plugins import deepgram as lk_deepgram
+        from livekit.plugins import openai as lk_openai
+        _PLUGINS = PluginBundle(
+            vad=silero.VAD.load(),
+            anthropic=lk_anthropic,
+            deepgram=lk_deepgram,
+            openai=lk_openai,
+        )
+    return _PLUGINS
+
 
 AGENT_PERSONALITIES = {
     "Atlas": {
@@ -104,20 +166,33 @@ MODE_INSTRUCTIONS = {
     "COPILOT": "\nYou are in COPILOT (whisper) mode. Provide brief contextual information during meetings. Keep responses very short.",
 }
 
-def _time_greeting(lang: str = "en") -> str:
-    """Return a time-appropriate greeting based on current hour."""
-    hour = datetime.now().hour
-    if hour < 12:
-        return "Good morning" if lang == "en" else "Suprabhat"
-    elif hour < 17:
-        return "Good afternoon" if lang == "en" else "Namaskar"
-    else:
-        return "Good evening" if lang == "en" else "Shubh sandhya"
 
+def _personality_block(agent_name: str) -> str:
+    personality = AGENT_PERSONALITIES.get(agent_name, {})
+    if personality:
+        return (
+            f"- Your style is {personality['style']}\n"
+            f"- {personality['traits']}\n"
+            f"- Example EN: \"{personality['example_en']}\"\n"
+            f"- Example HI: \"{personality['example_hi']}\""
+        )
+    return "- Sound like a trusted, sharp human chief of staff\n- Be warm but efficient"
+
+
+@lru_cache(maxsize=64)
+def _build_system_prompt(agent_name: str, mode: str) -> str:
+    """System prompt with the agent's name, personality, and mode-specific instructions."""
+    return SYSTEM_PROMPT_TEMPLATE.format(
+        agent_name=agent_name,
+        personality_block=_personality_block(agent_name),
+    ) + MODE_INSTRUCTIONS.get(mode, "")
 
-def _build_greetings(agent_name: str = "Kairo") -> dict:
-    en_g = _time_greeting("en")
-    hi_g = _time_greeting("hi")
+
+@lru_cache(maxsize=32)
+def _build_greetings(agent_name: str, bucket: int) -> dict:
+    """Greetings per mode and language. Cached, so callers must not mutate the result."""
+    en_g = _time_greeting("en", bucket)
+    hi_g = _time_greeting("hi", bucket)
     return {
         "BRIEFING": {
             "en": f"{en_g}! I'm {agent_name}. Let me prepare your briefing.",
@@ -137,13 +212,62 @@ def _build_greetings(agent_name: str = "Kairo") -> dict:
         },
     }
 
-MODE_GREETINGS = _build_greetings()  # default fallback
+MODE_GREETINGS = _build_greetings("Kairo", _hour_bucket())  # default fallback
+
+# Backchannel replies that can never be commands; the LLM handles them, so
+# the speech handler skips language tracking and command dispatch entirely.
+_ACKNOWLEDGEMENTS = frozenset({
+    "ok", "okay", "k", "yes", "yeah", "yep", "no", "sure", "cool", "right",
+    "alright", "got it", "thanks", "thank you", "mm", "hmm", "uh huh",
+    "haan", "han", "ha", "ji", "haan ji", "nahi", "accha", "achha",
+    "thik hai", "theek hai", "shukriya",
+})
+_ACK_PUNCTUATION = ".,!?"
 
 
 # ──────────────────────────────────────────
 # BACKEND API CLIENT
 # ──────────────────────────────────────────
 
+# Concurrent backend requests per session (briefings fan out several at once)
+BACKEND_CONCURRENCY = 8
+
+# A voice turn can't wait long on the backend; handlers fall back to spoken
+# placeholders on error. Heavier endpoints get a longer per-request timeout.
+HTTP_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+GET_TIMEOUTS = {
+    "/api/dashboard/weekly-report": 8.0,
+}
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+
+# One pooled client per event loop. httpx connections belong to the loop that
+# opened them, and LiveKit's thread executor runs jobs on their own loops.
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive httpx pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _shared_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            # retries=1 re-attempts failed connects only, never sent requests
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=1),
+            timeout=HTTP_TIMEOUT,
+        )
+        _shared_http_clients[loop] = client
+    return client
+
+
+async def close_shared_http_client():
+    client = _shared_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 class KairoBackendClient:
     """
     HTTP client for the Kairo FastAPI backend.
@@ -151,150 +275,241 @@ class KairoBackendClient:
     access goes through the REST API.
     """
 
-    def __init__(self, base_url: str = BACKEND_URL, token: str = ""):
+    def __init__(self, base_url: str = BACKEND_URL, token: str = "",
+                 http_client: Optional[httpx.AsyncClient] = None):
         self.base_url = base_url.rstrip("/")
         self.token = token
-        self._client: Optional[httpx.AsyncClient] = None
+        self._headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._client: Optional[httpx.AsyncClient] = http_client
+        # (path, params) -> (started_at, fetch task); see GET_CACHE_TTL(S).
+        # Holding the task, not the payload, lets a repeat join a GET in flight.
+        self._cache: dict[tuple, tuple[float, asyncio.Task]] = {}
+        self._sem = asyncio.Semaphore(BACKEND_CONCURRENCY)
 
     async def _ensure_client(self):
         if self._client is None or self._client.is_closed:
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=headers,
-                timeout=httpx.Timeout(30.0),
-            )
+            self._client = get_shared_http_client()
 
     async def close(self):
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        # The pool belongs to the event loop; whoever owns the loop closes it
+        # with close_shared_http_client().
+        self._client = None
+        for _, task in self._cache.values():
+            task.cancel()
+        self._cache.clear()
+
+    async def __aenter__(self) -> "KairoBackendClient":
+        await self._ensure_client()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
     def set_token(self, token: str):
+        # Auth travels per request, so the pooled connections stay warm.
         self.token = token
-        if self._client and not self._client.is_closed:
-            asyncio.get_event_loop().create_task(self._client.aclose())
-        self._client = None
-
-    async def get_stats(self) -> dict:
+        self._headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._cache.clear()
+
+    async def _get(
+        self, path: str, params: Optional[dict] = None, cached: bool = True,
+        max_age: Optional[float] = None,
+    ) -> Any:
+        """
+        GET a backend endpoint, serving repeats within the endpoint's TTL from
+        memory (or within max_age, when given). A repeat of a GET still in
+        flight waits for it instead of sending it again. cached=False skips the
+        lookup but still refreshes the entry.
+        """
+        key = (path, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        if cached:
+            if max_age is None:
+                max_age = GET_CACHE_TTLS.get(path, GET_CACHE_TTL)
+            hit = self._cache.get(key)
+            if hit is not None and now - hit[0] < max_age:
+                return await asyncio.shield(hit[1])
+        # The entry is stored before the request goes out, so a write that
+        # clears the cache meanwhile also discards this result.
+        entry = (now, asyncio.create_task(self._fetch(path, params)))
+        self._cache[key] = entry
+        entry[1].add_done_callback(lambda _: self._drop_failed(key, entry))
+        # Shielded so a cancelled caller doesn't cancel the GET for other waiters
+        return await asyncio.shield(entry[1])
+
+    async def _fetch(self, path: str, params: Optional[dict]) -> Any:
+        await self._ensure_client()
+        async with self._sem:
+            resp = await self._client.get(
+                f"{self.base_url}{path}", params=params, headers=self._headers,
+                timeout=GET_TIMEOUTS.get(path, httpx.USE_CLIENT_DEFAULT),
+            )
+        if not resp.is_success:
+            resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    def _drop_failed(self, key: tuple, entry: tuple[float, asyncio.Task]):
+        # Failures aren't cached; the next call retries
+        task = entry[1]
+        if task.cancelled() or task.exception() is not None:
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+
+    async def _post(self, path: str) -> Any:
+        """POST to a backend endpoint. Writes bypass and invalidate the GET cache."""
         await self._ensure_client()
-        resp = await self._client.get("/api/dashboard/stats")
-        resp.raise_for_status()
-        return resp.json()
+        async with self._sem:
+            resp = await self._client.post(f"{self.base_url}{path}", headers=self._headers)
+        if not resp.is_success:
+            resp.raise_for_status()
+        self.invalidate_cache()
+        return orjson.loads(resp.content)
+
+    def invalidate_cache(self):
+        self._cache.clear()
+
+    async def get_stats(self, cached: bool = True, max_age: Optional[float] = None) -> dict:
+        return await self._get("/api/dashboard/stats", cached=cached, max_age=max_age)
 
     async def get_decisions(self, limit: int = 20, status_filter: str = "all") -> dict:
-        await self._ensure_client()
-        resp = await self._client.get(
+        return await self._get(
             "/api/dashboard/decisions",
             params={"limit": limit, "status_filter": status_filter},
         )
-        resp.raise_for_status()
-        return resp.json()
 
     async def get_weekly_report(self) -> dict:
-        await self._ensure_client()
-        resp = await self._client.get("/api/dashboard/weekly-report")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._get("/api/dashboard/weekly-report")
+
+    async def get_briefing(self) -> dict:
+        try:
+            return await self._get("/api/dashboard/briefing")
+        except httpx.TimeoutException as e:
+            # compile_briefing skips its per-source fallback on timeouts
+            raise TimeoutError(str(e)) from e
 
     async def get_cross_context_alerts(self) -> dict:
-        await self._ensure_client()
-        resp = await self._client.get("/api/dashboard/cross-context-alerts")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._get("/api/dashboard/cross-context-alerts")
 
     async def get_tone_shifts(self) -> list:
-        await self._ensure_client()
-        resp = await self._client.get("/api/relationships/tone-shifts")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._get("/api/relationships/tone-shifts")
 
     async def get_neglected_contacts(self) -> list:
-        await self._ensure_client()
-        resp = await self._client.get("/api/relationships/neglected")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._get("/api/relationships/neglected")
 
-    async def get_agents(self) -> list:
-        await self._ensure_client()
-        resp = await self._client.get("/api/agents/")
-        resp.raise_for_status()
-        return resp.json()
+    async def get_agents(self, cached: bool = True) -> list:
+        return await self._get("/api/agents/", cached=cached)
 
     async def toggle_ghost_mode(self, agent_id: str) -> dict:
-        await self._ensure_client()
-        resp = await self._client.post(f"/api/agents/{agent_id}/ghost-mode/toggle")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._post(f"/api/agents/{agent_id}/ghost-mode/toggle")
 
     async def get_agent_detail(self, agent_id: str) -> dict:
-        await self._ensure_client()
-        resp = await self._client.get(f"/api/agents/{agent_id}")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._get(f"/api/agents/{agent_id}")
 
 
 # ──────────────────────────────────────────
 # LIVEKIT FUNCTION TOOLS (exposed to Claude via agents framework)
 # ──────────────────────────────────────────
 
-def build_function_tools(client: KairoBackendClient):
+# Backend client for the session whose task is running a tool. Set in
+# entrypoint before the session starts; LiveKit's tool tasks inherit it.
+_CURRENT_CLIENT: ContextVar[KairoBackendClient] = ContextVar("kairo_backend_client")
+
+# Decision fields Claude needs to talk about an action. Drafts, reasoning and
+# scoring factors are left out to keep tool results (and prompts) small.
+_DECISION_TOOL_FIELDS = (
+    "timestamp", "action_type", "channel", "target_contact",
+    "original_message_summary", "action_taken", "status",
+)
+
+
+def _project_decisions(decisions: dict) -> dict:
+    return {
+        "total": decisions.get("total", 0),
+        "actions": [
+            {field: action.get(field) for field in _DECISION_TOOL_FIELDS}
+            for action in decisions.get("actions", [])
+        ],
+    }
+
+
+@lru_cache(maxsize=1)
+def _function_tools() -> tuple:
     """
     Build LiveKit-compatible function tool definitions that Claude can call.
-    Each tool wraps a backend API call via httpx.
+    Each tool wraps a backend API call via httpx, using the session's client
+    from _CURRENT_CLIENT. Built once and shared by every session.
     """
     try:
         from livekit.agents import function_tool
     except ImportError:
         logger.warning("livekit.agents not available, skipping function tool registration")
-        return []
+        return ()
+
+    # Last encoded response per tool. While a GET is cached the client hands
+    # back the same object, so a repeated tool call skips re-serializing it.
+    last_json: dict[str, tuple[Any, str]] = {}
+
+    def _to_json(tool: str, value: Any, project=None) -> str:
+        cached = last_json.get(tool)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        encoded = orjson.dumps(project(value) if project else value).decode()
+        last_json[tool] = (value, encoded)
+        return encoded
 
     @function_tool(description="Get the user's dashboard stats including actions handled, time saved, and ghost mode status")
     async def get_dashboard_stats():
-        stats = await client.get_stats()
-        return json.dumps(stats)
+        client = _CURRENT_CLIENT.get()
+        stats = await client.get_stats(max_age=TOOL_STATS_MAX_AGE)
+        return _to_json("stats", stats)
 
     @function_tool(description="Get the user's weekly summary report with time saved, accuracy, and channel breakdown")
     async def get_weekly_report():
+        client = _CURRENT_CLIENT.get()
         report = await client.get_weekly_report()
-        return json.dumps(report)
+        return _to_json("weekly_report", report)
 
     @function_tool(description="Toggle ghost mode on or off for the user's agent")
     async def toggle_ghost_mode():
+        client = _CURRENT_CLIENT.get()
         agents = await client.get_agents()
         if not agents:
-            return json.dumps({"error": "No agent configured"})
+            return orjson.dumps({"error": "No agent configured"}).decode()
         agent_id = agents[0].get("id")
         result = await client.toggle_ghost_mode(agent_id)
-        return json.dumps(result)
+        return orjson.dumps(result).decode()
 
     @function_tool(description="Get recent decisions and actions taken by the agent, optionally filtered by status")
     async def get_recent_decisions(status_filter: str = "all"):
+        client = _CURRENT_CLIENT.get()
         decisions = await client.get_decisions(limit=15, status_filter=status_filter)
-        return json.dumps(decisions)
+        return _to_json("decisions", decisions, _project_decisions)
 
     @function_tool(description="Get tone shift alerts for the user's contacts")
     async def get_tone_shifts():
+        client = _CURRENT_CLIENT.get()
         shifts = await client.get_tone_shifts()
-        return json.dumps(shifts)
+        return _to_json("tone_shifts", shifts)
 
     @function_tool(description="Get contacts the user hasn't communicated with recently")
     async def get_neglected_contacts():
+        client = _CURRENT_CLIENT.get()
         neglected = await client.get_neglected_contacts()
-        return json.dumps(neglected)
+        return _to_json("neglected", neglected)
 
     @function_tool(description="Get a full morning briefing covering stats, pending items, tone shifts, and neglected contacts")
     async def get_morning_briefing():
+        client = _CURRENT_CLIENT.get()
         briefing = await compile_briefing(client, "en")
         return briefing
 
     @function_tool(description="Get a summary of what ghost mode handled while the user was away")
     async def get_ghost_debrief():
+        client = _CURRENT_CLIENT.get()
         summary = await get_ghost_summary(client, "en")
         return summary
 
-    return [
+    return (
         get_dashboard_stats,
         get_weekly_report,
         toggle_ghost_mode,
@@ -303,43 +518,139 @@ def build_function_tools(client: KairoBackendClient):
         get_neglected_contacts,
         get_morning_briefing,
         get_ghost_debrief,
-    ]
+    )
+
+
+def build_function_tools() -> list:
+    """Tool list for a new session. Set _CURRENT_CLIENT before the session starts."""
+    return list(_function_tools())
 
 
 # ──────────────────────────────────────────
 # TRANSCRIPT PUBLISHING HELPER
 # ──────────────────────────────────────────
 
-async def publish_transcript(room, role: str, text: str, msg_type: str = "transcript"):
-    """Publish a transcript data message to the LiveKit room for the frontend to display."""
+@lru_cache(maxsize=16)
+def _payload_prefix(msg_type: str, role: str) -> bytes:
+    # b'{"type":...,"role":...,"text":' — only the text varies per message
+    return orjson.dumps({"type": msg_type, "role": role})[:-1] + b',"text":'
+
+
+def transcript_payload(role: str, text: str, msg_type: str = "transcript") -> bytes:
+    """Encode a transcript data message the way the frontend expects it."""
+    return _payload_prefix(msg_type, role) + orjson.dumps(text) + b"}"
+
+
+@lru_cache(maxsize=64)
+def _greeting_payload(greeting: str) -> bytes:
+    # Greetings repeat across sessions, so their encoded form is reused
+    return transcript_payload("agent", greeting)
+
+
+async def publish_payload(room, payload: bytes):
+    """Publish an encoded transcript message to the LiveKit room."""
     try:
-        payload = json.dumps({"type": msg_type, "role": role, "text": text}).encode()
         await room.local_participant.publish_data(payload, reliable=True)
     except Exception as e:
         logger.warning(f"Failed to publish transcript: {e}")
 
 
+async def publish_transcript(room, role: str, text: str, msg_type: str = "transcript"):
+    """Publish a transcript data message to the LiveKit room for the frontend to display."""
+    await publish_payload(room, transcript_payload(role, text, msg_type))
+
+
+# Zero-width split after sentence-ending punctuation (incl. the Devanagari danda)
+_SENTENCE_END_RE = re.compile(r"(?<=[.?!।])(?=\s)")
+
+
+async def iter_sentences(text: str):
+    """Yield a reply sentence by sentence so TTS can start on the first one.
+
+    Chunks keep their leading whitespace, so they concatenate back to `text`.
+    """
+    for chunk in _SENTENCE_END_RE.split(text):
+        if chunk:
+            yield chunk
+
+
+# Fixed command replies are rendered once per (voice, text) and replayed as
+# audio on every hit, the first included. Keys are limited to the voices times
+# the _STATIC_RESPONSES texts. Shared by all sessions, and so by every job
+# thread: all access goes through _STATIC_AUDIO_LOCK.
+_STATIC_AUDIO: dict[tuple[str, str], tuple] = {}
+_STATIC_AUDIO_PENDING: set[tuple[str, str]] = set()
+_STATIC_AUDIO_LOCK = threading.Lock()
+
+
+def _static_audio_or_claim(key: tuple[str, str]) -> tuple[Optional[tuple], bool]:
+    """Cached frames for key, and whether the caller should render them now."""
+    with _STATIC_AUDIO_LOCK:
+        frames = _STATIC_AUDIO.get(key)
+        if frames is not None or key in _STATIC_AUDIO_PENDING:
+            return frames, False
+        _STATIC_AUDIO_PENDING.add(key)
+        return None, True
+
+
+async def _render_static_audio(tts, voice: str, text: str) -> Optional[tuple]:
+    """Synthesize a fixed reply, keep its frames, and return them (None on failure)."""
+    key = (voice, text)
+    frames = None
+    try:
+        chunks = []
+        async with tts.synthesize(text) as stream:
+            async for chunk in stream:
+                chunks.append(chunk.frame)
+        if chunks:
+            frames = tuple(chunks)
+    except Exception as e:
+        logger.warning(f"Static reply render failed: {e}")
+    finally:
+        with _STATIC_AUDIO_LOCK:
+            if frames is not None:
+                _STATIC_AUDIO[key] = frames
+            _STATIC_AUDIO_PENDING.discard(key)
+    return frames
+
+
+async def _replay_frames(frames: tuple):
+    for frame in frames:
+        yield frame
+
+
+def _dict_event_text(event) -> str:
+    return event.get("text", "")
+
+
+def _attr_event_text(event) -> str:
+    return getattr(event, "text", "") or ""
+
+
+def _event_text_getter(event):
+    """Text accessor for committed-speech events: plain dicts or event objects."""
+    return _dict_event_text if isinstance(event, dict) else _attr_event_text
+
+
 # ──────────────────────────────────────────
 # LIVEKIT SESSION ENTRYPOINT (module-level for pickling)
 # ──────────────────────────────────────────
 
-_server = None  # set during run_voice_agent
+# Room name format from tts.py: "kairo-voice-{user_id}-{timestamp}"; user ids may contain hyphens
+_ROOM_RE = re.compile(r"^kairo-voice-(?P<uid>.+)-(?P<ts>\d+)$")
 
 
-def _get_server():
-    """Lazy-create the AgentServer (must be called after env vars are set)."""
-    global _server
-    if _server is None:
-        from livekit.agents import AgentServer
-        _server = AgentServer()
-    return _server
+@lru_cache(maxsize=256)
+def _session_token(user_id: str, hour: int) -> str:
+    """Backend JWT for a voice session, reused for the same user within an hour."""
+    from services.auth import create_access_token
+    return create_access_token(user_id, email="")
 
 
 async def entrypoint(ctx):
     """LiveKit session entrypoint — must be module-level for multiprocessing pickling."""
-    from livekit.agents import AgentSession
-    from livekit.agents import inference
-    from services.edge_tts_service import EdgeTTSService
+    if AgentSession is None:
+        raise RuntimeError("livekit-agents is not installed — the voice entrypoint requires it")
 
     # Extract mode/language/token from room name or participant metadata.
     # Note: with @server.rtc_session(), the room is NOT connected yet at this point.
@@ -350,23 +661,44 @@ async def entrypoint(ctx):
 
     # Generate auth token directly from room name (contains user_id)
     room_name = ctx.room.name or ""
-    if room_name.startswith("kairo-voice-"):
-        parts = room_name.split("-")  # kairo-voice-{user_id}-{timestamp}
-        if len(parts) >= 4:
-            user_id_from_room = "-".join(parts[2:-1])  # handles user-demo style IDs
-            from services.auth import create_access_token
-            user_token = create_access_token(user_id_from_room, email="")
-            logger.info(f"Generated token for user: {user_id_from_room}")
+    room_match = _ROOM_RE.match(room_name)
+    if room_match:
+        user_id_from_room = room_match["uid"]
+        user_token = await asyncio.to_thread(
+            _session_token, user_id_from_room, int(time.time() // 3600)
+        )
+        logger.info(f"Generated token for user: {user_id_from_room}")
 
     backend_client = KairoBackendClient(token=user_token)
 
+    # Parsed participant metadata by SID, dropped when it changes or they leave
+    participant_meta: dict[str, dict] = {}
+
+    def _participant_meta(participant) -> dict:
+        meta = participant_meta.get(participant.sid)
+        if meta is None:
+            try:
+                meta = orjson.loads(participant.metadata or "{}")
+            except orjson.JSONDecodeError:
+                meta = {}
+            participant_meta[participant.sid] = meta
+        return meta
+
+    @ctx.room.on("participant_metadata_changed")
+    def _on_metadata_changed(participant, *_):
+        participant_meta.pop(participant.sid, None)
+
+    @ctx.room.on("participant_disconnected")
+    def _on_participant_left(participant):
+        participant_meta.pop(participant.sid, None)
+
     # Extract mode/language from participant metadata once they connect
     @ctx.room.on("participant_connected")
     def _on_participant(participant):
         nonlocal session_mode, session_language
-        if participant.metadata:
+        p_meta = _participant_meta(participant)
+        if p_meta:
             try:
-                p_meta = json.loads(participant.metadata)
                 session_mode = p_meta.get("mode", session_mode).upper()
                 new_lang = p_meta.get("language", session_language).lower()
                 session_language = "en" if new_lang == "auto" else new_lang
@@ -375,20 +707,24 @@ async def entrypoint(ctx):
                 if t:
                     backend_client.set_token(t)
                 logger.info(f"Participant joined: mode={session_mode}, language={session_language}")
-            except (json.JSONDecodeError, AttributeError):
+            except AttributeError:
                 pass
 
+    # Fetch the agent config while TTS and tools are set up
+    agents_task = asyncio.create_task(backend_client.get_agents())
+
     # Initialize Edge TTS (used as fallback; gender updated after agent fetch)
     tts = EdgeTTSService(language=session_language, gender="female")
 
-    # Build function tools for Claude
-    tools = build_function_tools(backend_client)
+    # Function tools for Claude resolve this session's client from the context
+    _CURRENT_CLIENT.set(backend_client)
+    tools = build_function_tools()
 
     # Fetch agent name and voice gender from backend
     agent_name = "Kairo"
     voice_gender = "female"
     try:
-        agents_list = await backend_client.get_agents()
+        agents_list = await agents_task
         if agents_list:
             agent_data = agents_list[0]
             if agent_data.get("name"):
@@ -403,54 +739,48 @@ async def entrypoint(ctx):
     # Update Edge TTS gender to match agent config
     tts.gender = voice_gender
 
-    # Build personality block from agent name
-    personality = AGENT_PERSONALITIES.get(agent_name, {})
-    if personality:
-        personality_block = (
-            f"- Your style is {personality['style']}\n"
-            f"- {personality['traits']}\n"
-            f"- Example EN: \"{personality['example_en']}\"\n"
-            f"- Example HI: \"{personality['example_hi']}\""
-        )
-    else:
-        personality_block = "- Sound like a trusted, sharp human chief of staff\n- Be warm but efficient"
+    # System prompt with mode-specific instructions, agent name, and personality
+    system_prompt = _build_system_prompt(agent_name, session_mode)
 
-    # Build system prompt with mode-specific instructions, agent name, and personality
-    system_prompt = SYSTEM_PROMPT_TEMPLATE.format(
-        agent_name=agent_name,
-        personality_block=personality_block,
-    ) + MODE_INSTRUCTIONS.get(session_mode, "")
-
-    from livekit.agents import Agent
-
-    # Use cached plugin references registered on the main thread.
+    # Use plugins registered on the main thread by load_plugins().
     # Importing livekit.plugins.* in a job thread triggers Plugin.register_plugin()
     # which raises "Plugins must be registered on the main thread".
-    lk_anthropic = _lk_anthropic
-    lk_deepgram = _lk_deepgram
-    lk_openai = _lk_openai
-
-    if lk_anthropic is None or lk_deepgram is None or lk_openai is None:
-        # Fallback for standalone mode (python -m voice.kairo_voice_agent)
-        from livekit.plugins import anthropic as lk_anthropic
-        from livekit.plugins import deepgram as lk_deepgram
-        from livekit.plugins import openai as lk_openai
+    plugins = _PLUGINS
+    if plugins is None:
+        raise RuntimeError("LiveKit plugins not loaded — call load_plugins() on the main thread first")
 
     # Use OpenAI TTS with voice matched to agent gender config
     tts_voice_map = {"male": "echo", "female": "nova"}
     tts_voice = tts_voice_map.get(voice_gender, "nova")
-    openai_tts = lk_openai.TTS(model="gpt-4o-mini-tts", voice=tts_voice)
+    openai_tts = plugins.openai.TTS(model="gpt-4o-mini-tts", voice=tts_voice)
     logger.info(f"OpenAI TTS voice: {tts_voice} (gender={voice_gender})")
 
-    # Use cached VAD loaded on main thread
-    vad = _cached_vad if _cached_vad is not None else silero.VAD.load()
+    # Stream interim hypotheses so commands can be recognized mid-utterance
+    deepgram_stt = plugins.deepgram.STT(
+        model="nova-3",
+        language="multi",
+        interim_results=True,
+        smart_format=True,
+        no_delay=True,
+        endpointing_ms=300,
+    )
+    anthropic_llm = plugins.anthropic.LLM(model=settings.anthropic_model)
+
+    # Open provider connections now so their handshakes overlap the room join
+    for component in (deepgram_stt, anthropic_llm, openai_tts):
+        prewarm = getattr(component, "prewarm", None)
+        if prewarm is not None:
+            try:
+                prewarm()
+            except Exception as e:
+                logger.warning(f"Prewarm failed for {type(component).__name__}: {e}")
 
     agent = Agent(
         instructions=system_prompt,
         tools=tools,
-        vad=vad,
-        stt=lk_deepgram.STT(model="nova-3", language="multi"),
-        llm=lk_anthropic.LLM(model=settings.anthropic_model),
+        vad=plugins.vad,
+        stt=deepgram_stt,
+        llm=anthropic_llm,
         tts=openai_tts,
     )
 
@@ -465,91 +795,169 @@ async def entrypoint(ctx):
         min_interruption_words=3,
     )
 
+    # Speech and quick-command events each go through one bounded queue and
+    # worker, so replies keep arrival order and bursts can't pile up tasks.
+    speech_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    data_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    # Transcripts are published by their own worker so replies never wait on them
+    transcript_queue: asyncio.Queue = asyncio.Queue(maxsize=TRANSCRIPT_QUEUE_SIZE)
+
+    def _enqueue(queue: asyncio.Queue, item):
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Worker is behind — the newest input supersedes the oldest
+            queue.get_nowait()
+            queue.put_nowait(item)
+            logger.warning("Voice event queue full, dropped oldest event")
+
+    async def _drain(queue: asyncio.Queue, handler):
+        while True:
+            item = await queue.get()
+            try:
+                await handler(item)
+            except Exception as e:
+                logger.error(f"Voice event handler error: {e}")
+
+    def _publish(role: str, text: str):
+        _enqueue(transcript_queue, transcript_payload(role, text))
+
+    async def _send_transcript(payload: bytes):
+        await publish_payload(ctx.room, payload)
+
     @session.on("user_speech_committed")
     def _on_speech(event):
-        asyncio.create_task(_handle_speech(event))
+        _enqueue(speech_queue, event)
 
-    async def _handle_speech(event):
+    # In-flight prefetches; cancelled with the session
+    prefetches: set[asyncio.Task] = set()
+
+    @session.on("user_input_transcribed")
+    def _on_transcribed(event):
+        # A final transcript that reads as a data-backed command warms the
+        # backend cache before the turn is committed and dispatched.
+        if not getattr(event, "is_final", False):
+            return
+        cmd_type, _ = parse_command(getattr(event, "transcript", "") or "")
+        task = asyncio.create_task(prefetch_command(backend_client, cmd_type))
+        prefetches.add(task)
+        task.add_done_callback(prefetches.discard)
+
+    async def _say(response: str, cmd_type: str):
+        """Queue a reply, replaying rendered audio for fixed command text."""
+        if cmd_type in _STATIC_RESPONSES:
+            frames, claimed = _static_audio_or_claim((tts_voice, response))
+            # Render inside the calling worker so teardown cancels it; if another
+            # session is already rendering this reply, just stream it this once.
+            if claimed:
+                frames = await _render_static_audio(openai_tts, tts_voice, response)
+            if frames is not None:
+                return session.say(response, audio=_replay_frames(frames))
+        return session.say(iter_sentences(response))
+
+    def _track_language(text: str) -> str:
+        """Update the session language from an utterance and return it."""
         nonlocal _current_lang
-        text = event.get("text", "") if isinstance(event, dict) else getattr(event, "text", "")
+        # Short romanized replies ("ok", "haan") can't be classified reliably
+        if len(text) < 8 and text.isascii():
+            return _current_lang
+        detected = detect_language(text)
+        if detected != _current_lang:
+            _current_lang = detected
+            logger.info(f"Language switched to {detected} (TTS: {tts_language_for(detected)})")
+        return _current_lang
+
+    # Speech events from one session all share a shape; pick the accessor once
+    event_text = None
+
+    async def _handle_speech(event):
+        nonlocal event_text
+        if event_text is None:
+            event_text = _event_text_getter(event)
+        text = event_text(event)
         if not text:
             return
 
         # Publish user transcript
-        await publish_transcript(ctx.room, "user", text)
+        _publish("user", text)
+        if text.strip().rstrip(_ACK_PUNCTUATION).lower() in _ACKNOWLEDGEMENTS:
+            return
 
         try:
-            detected = detect_language(text)
-            if detected != _current_lang:
-                _current_lang = detected
-                tts_lang = tts_language_for(detected)
-                logger.info(f"Language switched to {detected}")
-                logger.info(f"Language switched to {detected} (TTS: {tts_lang})")
-
-            response, cmd_type = await dispatch_command(backend_client, text, _current_lang)
+            lang = _track_language(text)
+            response, cmd_type = await dispatch_command(backend_client, text, lang)
             if response:
-                await publish_transcript(ctx.room, "agent", response)
+                _publish("agent", response)
                 try:
-                    await session.say(response)
+                    # Queue the reply without waiting for playout; the session
+                    # plays speech in order and handles barge-in itself
+                    await _say(response, cmd_type)
                 except Exception as e:
                     logger.warning(f"session.say() failed: {e}")
         except Exception as e:
             logger.error(f"Command dispatch error: {e}")
 
-    # Handle data packets for quick commands (sync callback, dispatches async work)
+    # Handle data packets for quick commands (sync callback, queues async work)
     @ctx.room.on("data_received")
     def _on_data(data_packet):
-        asyncio.create_task(_handle_data(data_packet))
+        _enqueue(data_queue, data_packet)
 
     async def _handle_data(data_packet):
-        nonlocal _current_lang
         try:
             payload = data_packet.data if hasattr(data_packet, 'data') else data_packet
-            if isinstance(payload, bytes):
-                payload = payload.decode("utf-8")
-            msg = json.loads(payload)
+            msg = orjson.loads(payload)  # accepts bytes or str
 
             if msg.get("type") == "command":
                 command_text = msg.get("text", "")
                 if not command_text:
                     return
 
-                await publish_transcript(ctx.room, "user", command_text)
-
-                detected = detect_language(command_text)
-                _current_lang = detected
-                logger.info(f"Quick command language: {detected}")
+                _publish("user", command_text)
 
-                response, cmd_type = await dispatch_command(backend_client, command_text, detected)
+                lang = _track_language(command_text)
+                response, cmd_type = await dispatch_command(backend_client, command_text, lang)
 
                 if response is None:
-                    response = _t(detected,
-                        en="I'll look into that for you.",
-                        hi="Main dekhta hoon.")
+                    response = _t(lang, en="I'll look into that for you.", hi="Main dekhta hoon.")
 
-                await publish_transcript(ctx.room, "agent", response)
+                _publish("agent", response)
 
                 try:
-                    await session.say(response)
+                    await _say(response, cmd_type)
                 except Exception as e:
                     logger.warning(f"session.say() failed for quick command: {e}")
 
-        except (json.JSONDecodeError, UnicodeDecodeError):
+        except orjson.JSONDecodeError:
             pass
         except Exception as e:
             logger.error(f"Data packet handler error: {e}")
 
+    # Set when the room goes away; registered before start so it can't be missed
+    disconnected = asyncio.Event()
+    ctx.room.on("disconnected", lambda *_: disconnected.set())
+
+    workers = [
+        asyncio.create_task(_drain(speech_queue, _handle_speech)),
+        asyncio.create_task(_drain(data_queue, _handle_data)),
+        asyncio.create_task(_drain(transcript_queue, _send_transcript)),
+    ]
+
     await session.start(agent=agent, room=ctx.room)
 
     # Send initial greeting based on mode, language, and agent name
     try:
-        dynamic_greetings = _build_greetings(agent_name)
+        dynamic_greetings = _build_greetings(agent_name, _hour_bucket())
         mode_greeting = dynamic_greetings.get(session_mode, dynamic_greetings["COMMAND"])
-        greeting_lang = "hi" if session_language in ("hi", "hinglish") else "en"
+        greeting_lang = "hi" if session_language in _HI_LANGS else "en"
         greeting = mode_greeting.get(greeting_lang, mode_greeting["en"])
 
+        # In BRIEFING mode, compile the briefing while the greeting plays
+        briefing_task = None
+        if session_mode == "BRIEFING":
+            briefing_task = asyncio.create_task(compile_briefing(backend_client, greeting_lang))
+
         # Publish greeting transcript
-        await publish_transcript(ctx.room, "agent", greeting)
+        _enqueue(transcript_queue, _greeting_payload(greeting))
 
         try:
             await session.say(greeting)
@@ -559,12 +967,12 @@ async def entrypoint(ctx):
             logger.warning(f"Greeting say() failed: {e}")
 
         # Auto-trigger briefing in BRIEFING mode
-        if session_mode == "BRIEFING":
+        if briefing_task is not None:
             try:
-                briefing = await compile_briefing(backend_client, greeting_lang)
-                await publish_transcript(ctx.room, "agent", briefing)
+                briefing = await briefing_task
+                _publish("agent", briefing)
                 try:
-                    await session.say(briefing)
+                    await session.say(iter_sentences(briefing))
                 except AttributeError:
                     logger.info(f"Briefing (say unavailable): {briefing[:80]}...")
                 except Exception as e:
@@ -575,24 +983,39 @@ async def entrypoint(ctx):
     except Exception as e:
         logger.warning(f"Initial greeting failed: {e}")
 
-    # Keep session alive
+    # Keep session alive until the room disconnects
     try:
-        await asyncio.Event().wait()
+        await disconnected.wait()
     except asyncio.CancelledError:
         pass
     finally:
+        for task in (*workers, *prefetches):
+            task.cancel()
         await backend_client.close()
+        # Each job runs on its own loop, so this session owns the loop's pool
+        await close_shared_http_client()
 
 
 # ──────────────────────────────────────────
 # LIVEKIT VOICE AGENT ENTRY POINT
 # ──────────────────────────────────────────
 
+# (environment variable, settings attribute) pairs exported for the LiveKit SDK and plugins
+_SETTINGS_ENV = (
+    ("LIVEKIT_URL", "livekit_url"),
+    ("LIVEKIT_API_KEY", "livekit_api_key"),
+    ("LIVEKIT_API_SECRET", "livekit_api_secret"),
+    ("ANTHROPIC_API_KEY", "anthropic_api_key"),
+    ("DEEPGRAM_API_KEY", "deepgram_api_key"),
+    ("OPENAI_API_KEY", "openai_api_key"),
+)
+
+
 def run_voice_agent(skip_plugin_load: bool = False):
     """Entry point for the LiveKit voice agent.
 
     Args:
-        skip_plugin_load: If True, skip Silero VAD registration (already done on main thread).
+        skip_plugin_load: If True, skip plugin registration (load_plugins() already ran on main thread).
     """
     import sys
     print("=== Kairo Voice Agent starting ===", flush=True)
@@ -606,40 +1029,21 @@ def run_voice_agent(skip_plugin_load: bool = False):
         from livekit.agents.worker import JobExecutorType
         print("LiveKit SDK imported OK", flush=True)
 
-        # LiveKit SDK reads env vars directly — export from our settings
+        # LiveKit SDK and plugins read env vars directly — export from our settings
         _s = get_settings()
-        os.environ.setdefault("LIVEKIT_URL", _s.livekit_url)
-        os.environ.setdefault("LIVEKIT_API_KEY", _s.livekit_api_key)
-        os.environ.setdefault("LIVEKIT_API_SECRET", _s.livekit_api_secret)
-        # LiveKit plugins read API keys from env vars — export from settings
-        for env_var, attr in [
-            ("ANTHROPIC_API_KEY", "anthropic_api_key"),
-            ("DEEPGRAM_API_KEY", "deepgram_api_key"),
-            ("OPENAI_API_KEY", "openai_api_key"),
-        ]:
+        for env_var, attr in _SETTINGS_ENV:
             val = getattr(_s, attr, "")
             if val:
                 os.environ.setdefault(env_var, val)
         print(f"LIVEKIT_URL={os.environ.get('LIVEKIT_URL', 'NOT SET')}", flush=True)
 
         # Register ALL plugins on main thread BEFORE server starts (required for thread executor)
-        global _cached_vad, _lk_anthropic, _lk_deepgram, _lk_openai
         if not skip_plugin_load:
             print("Loading plugins on main thread...", flush=True)
-            from livekit.plugins import silero
-            from livekit.plugins import anthropic as lk_anthropic
-            from livekit.plugins import deepgram as lk_deepgram
-            from livekit.plugins import openai as lk_openai
-            _cached_vad = silero.VAD.load()
-            _lk_anthropic = lk_anthropic
-            _lk_deepgram = lk_deepgram
-            _lk_openai = lk_openai
+            load_plugins()
             print("All plugins loaded OK", flush=True)
         else:
             print("Plugins already loaded on main thread", flush=True)
-            if _cached_vad is None:
-                from livekit.plugins import silero
-                _cached_vad = silero.VAD.load()
 
         server = AgentServer(job_executor_type=JobExecutorType.THREAD)
         print("AgentServer created", flush=True)
@@ -648,8 +1052,23 @@ def run_voice_agent(skip_plugin_load: bool = False):
         async def _entrypoint(ctx):
             await entrypoint(ctx)
 
+        async def _serve():
+            try:
+                await server.run()
+            finally:
+                await close_shared_http_client()
+
+        # uvloop when available; a Runner keeps the global loop policy untouched
+        # since this may run in a thread beside the API server's own loop.
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+
         logger.info("Kairo voice agent starting...")
-        asyncio.run(server.run())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(_serve())
 
     except ImportError as e:
         logger.warning(f"LiveKit not fully installed: {e}")
@@ -663,42 +1082,77 @@ def run_voice_agent(skip_plugin_load: bool = False):
 # STANDALONE TESTING (no LiveKit required)
 # ──────────────────────────────────────────
 
-async def _test_command_pipeline():
-    """Quick self-test of the command parsing pipeline."""
+async def _test_command_pipeline() -> int:
+    """Quick self-test of the command parsing pipeline. Returns the failure count."""
+    # (utterance, command type it parsed to before the pattern table was optimized);
+    # every CommandType appears at least once.
     test_cases = [
-        "What did I miss?",
-        "Kya miss hua?",
-        "What's my schedule today?",
-        "Aaj ka schedule kya hai?",
-        "Toggle ghost mode",
-        "Ghost mode on",
-        "Weekly summary",
-        "Hafta kaisa raha?",
-        "Move my 3pm meeting",
-        "Reply to Sarah",
-        "Sarah ko reply kar",
-        "Send 'I'll be late' to John",
-        "John ko bhej: main late hounga",
-        "Give me my briefing",
-        "Ghost mode summary",
-        "What's the weather like?",  # Should be GENERAL
+        ("What did I miss?", CommandType.MISSED_SUMMARY),
+        ("Kya miss hua?", CommandType.MISSED_SUMMARY),
+        ("What's my schedule today?", CommandType.SCHEDULE_TODAY),
+        ("Aaj ka schedule kya hai?", CommandType.SCHEDULE_TODAY),
+        ("Toggle ghost mode", CommandType.GHOST_TOGGLE),
+        ("Ghost mode on", CommandType.GHOST_TOGGLE),
+        ("Weekly summary", CommandType.WEEKLY_SUMMARY),
+        ("Hafta kaisa raha?", CommandType.WEEKLY_SUMMARY),
+        ("Move my 3pm meeting", CommandType.RESCHEDULE),
+        ("Reply to Sarah", CommandType.DRAFT_REPLY),
+        ("Sarah ko reply kar", CommandType.DRAFT_REPLY),
+        ("Send 'I'll be late' to John", CommandType.SEND_MESSAGE),
+        ("John ko bhej: main late hounga", CommandType.SEND_MESSAGE),
+        ("Give me my briefing", CommandType.BRIEFING),
+        ("Ghost mode summary", CommandType.GHOST_DEBRIEF),
+        ("Show my commitments", CommandType.COMMITMENTS),
+        ("Kya promise kiya tha?", CommandType.COMMITMENTS),
+        ("What's my commitment score?", CommandType.COMMITMENT_STATUS),
+        ("Delegate the deck review to Priya", CommandType.DELEGATE_TASK),
+        ("Kisko assign karun yeh report?", CommandType.DELEGATE_TASK),
+        ("Am I burning out?", CommandType.BURNOUT_CHECK),
+        ("When am I most productive?", CommandType.PRODUCTIVITY_TIPS),
+        ("What if I had declined that meeting?", CommandType.DECISION_REPLAY),
+        ("What's my flow status?", CommandType.FLOW_STATUS),
+        ("Start flow", CommandType.FLOW_START),
+        ("Focus karo", CommandType.FLOW_START),
+        ("End flow", CommandType.FLOW_END),
+        ("Flow debrief", CommandType.FLOW_DEBRIEF),
+        ("Set up my agent", CommandType.SETUP_AGENT),
+        ("Connect my gmail and slack", CommandType.SETUP_AGENT),
+        ("What's the weather like?", CommandType.GENERAL),
     ]
 
-    print("\n--- Command Parser Test ---\n")
-    for text in test_cases:
+    lines = ["", "--- Command Parser Test ---", ""]
+    failures = 0
+    start = time.perf_counter()
+    for text, expected in test_cases:
         cmd_type, params = parse_command(text)
         lang = detect_language(text)
         tts_lang = tts_language_for(lang)
-        print(f"  [{lang:>8}] [{tts_lang:>4}] {cmd_type:<20} | {text}")
+        mark = "ok" if cmd_type == expected else "FAIL"
+        lines.append(f"  {mark:<4} [{lang:>8}] [{tts_lang:>4}] {cmd_type:<20} | {text}")
+        if cmd_type != expected:
+            failures += 1
+            lines.append(f"           expected: {expected}")
         if params:
-            print(f"           params: {params}")
-    print()
+            lines.append(f"           params: {params}")
+    elapsed = time.perf_counter() - start
+
+    all_types = {v for k, v in vars(CommandType).items() if not k.startswith("_")}
+    missing = all_types - {expected for _, expected in test_cases}
+    if missing:
+        failures += len(missing)
+        lines.append(f"  FAIL no test case for: {', '.join(sorted(missing))}")
+
+    lines.append("")
+    lines.append(f"Parsed {len(test_cases)} utterances in {elapsed * 1000:.2f} ms, {failures} failure(s)")
+    # One write for the whole report, so output doesn't skew the timing
+    print("\n".join(lines) + "\n")
+    return failures
 
 
 if __name__ == "__main__":
     import sys
 
     if "--test" in sys.argv:
-        asyncio.run(_test_command_pipeline())
+        sys.exit(1 if asyncio.run(_test_command_pipeline()) else 0)
     else:
         run_voice_agent()
@@ -5,10 +5,14 @@ Routes: POST /webhooks/email, /webhooks/slack, /webhooks/teams, /webhooks/calend
 
 from fastapi import APIRouter, Request, BackgroundTasks
 from datetime import datetime, timezone
+from typing import Optional
+import asyncio
 import logging
+import orjson
 
-from models.database import AgentAction, AgentConfig, get_engine, create_session_factory
+from models.database import AgentAction, get_engine, create_session_factory
 from services.relationship_graph import get_relationship_graph
+from services.agent_runtime import get_runtime_manager, cached_running_agent_id
 from config import get_settings
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
@@ -17,26 +21,111 @@ engine = get_engine(settings.database_url)
 SessionLocal = create_session_factory(engine)
 logger = logging.getLogger("kairo.webhooks")
 
+# Fallback actions are written in batches: one commit per burst of webhooks
+ACTION_BATCH_SIZE = 128
+ACTION_FLUSH_INTERVAL = 0.05  # seconds to let a burst accumulate
+ACTION_QUEUE_SIZE = 1024
+
+# Incoming webhooks are handed to one consumer that runs at most this many at once
+WEBHOOK_QUEUE_SIZE = 1024
+WEBHOOK_CONCURRENCY = 32
+WEBHOOK_DRAIN_TIMEOUT = 10.0  # seconds to finish queued webhooks on shutdown
+
+_action_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+_ingress_queue: Optional[asyncio.Queue] = None
+_ingress_task: Optional[asyncio.Task] = None
+# Set on shutdown, before the consumer and then the batch writer are stopped
+_ingress_closed = False
+_actions_closed = False
+
+
+def _write_actions(actions: list[AgentAction]):
+    db = SessionLocal()
+    try:
+        db.add_all(actions)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _flush_actions(queue: asyncio.Queue):
+    """Drain queued actions into one commit per batch. A None item stops the loop."""
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(ACTION_FLUSH_INTERVAL)
+        while len(batch) < ACTION_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        actions = [a for a in batch if a is not None]
+        if actions:
+            try:
+                await asyncio.to_thread(_write_actions, actions)
+            except Exception as e:
+                # Retry row by row so one bad action doesn't take the batch with it
+                logger.warning(f"Webhook action batch of {len(actions)} failed, retrying singly: {e}")
+                for action in actions:
+                    try:
+                        await asyncio.to_thread(_write_actions, [action])
+                    except Exception as e:
+                        logger.error(f"Webhook action for {action.target_contact} ({action.channel}) failed: {e}")
+        if len(actions) < len(batch):
+            return
+
+
+def _queue_action(action: AgentAction) -> bool:
+    """Hand an action to the batch writer. False if the queue is full or closed."""
+    global _action_queue, _flusher_task
+    if _actions_closed:
+        return False
+    if _action_queue is None:
+        _action_queue = asyncio.Queue(maxsize=ACTION_QUEUE_SIZE)
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_flush_actions(_action_queue))
+    try:
+        _action_queue.put_nowait(action)
+        return True
+    except asyncio.QueueFull:
+        return False
+
+
+async def flush_pending_actions():
+    """Finish queued webhooks, write any queued actions and stop the batch writer. Called on shutdown."""
+    global _flusher_task, _ingress_task, _ingress_closed, _actions_closed
+    _ingress_closed = True
+    if _ingress_queue is not None:
+        try:
+            await asyncio.wait_for(_ingress_queue.join(), WEBHOOK_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"{_ingress_queue.qsize()} webhook(s) still queued at shutdown")
+    if _ingress_task is not None:
+        # Stops the consumer and any webhooks it is still running
+        _ingress_task.cancel()
+        await asyncio.gather(_ingress_task, return_exceptions=True)
+        _ingress_task = None
+    # From here on actions are written directly rather than queued
+    _actions_closed = True
+    if _flusher_task is None or _flusher_task.done():
+        return
+    await _action_queue.put(None)
+    await _flusher_task
+    _flusher_task = None
+
 
 async def process_incoming_message(channel: str, payload: dict):
     """Background task: route incoming message through the agent runtime pipeline."""
-    db = SessionLocal()
+    # Sync DB work runs in worker threads so a webhook burst doesn't stall the loop
     try:
         user_id = payload.get("user_id")
         if not user_id:
             return
 
-        agent = db.query(AgentConfig).filter(
-            AgentConfig.user_id == user_id,
-            AgentConfig.status == "running"
-        ).first()
-        if not agent:
+        agent_id = await cached_running_agent_id(user_id)
+        if not agent_id:
             return
 
         # Route through the runtime manager → full Observe → Reason → Act pipeline
-        from services.agent_runtime import get_runtime_manager
         runtime_mgr = get_runtime_manager()
-        runtime = runtime_mgr.get_runtime(agent.id)
+        runtime = runtime_mgr.get_runtime(agent_id)
 
         if runtime:
             result = await runtime.process_incoming(channel, payload)
@@ -51,7 +140,7 @@ async def process_incoming_message(channel: str, payload: dict):
 
             action = AgentAction(
                 user_id=user_id,
-                agent_id=agent.id,
+                agent_id=agent_id,
                 action_type=f"{channel}_queued",
                 channel=channel,
                 target_contact=sender,
@@ -62,40 +151,80 @@ async def process_incoming_message(channel: str, payload: dict):
                 reasoning="Agent runtime not loaded — queued for review",
                 status="queued_for_review",
             )
-            db.add(action)
-            db.commit()
+            if not _queue_action(action):
+                # Batch writer is backed up — write this one directly
+                await asyncio.to_thread(_write_actions, [action])
             logger.info(f"Webhook fallback: {channel} from {sender} queued")
 
     except Exception as e:
         logger.error(f"Webhook processing error: {e}")
+
+
+async def _consume_webhooks(queue: asyncio.Queue):
+    """Run queued webhooks, at most WEBHOOK_CONCURRENCY at a time."""
+    sem = asyncio.Semaphore(WEBHOOK_CONCURRENCY)
+    running: set[asyncio.Task] = set()
+
+    async def _run(channel: str, payload: dict):
+        try:
+            await process_incoming_message(channel, payload)
+        finally:
+            sem.release()
+            queue.task_done()
+
+    try:
+        while True:
+            channel, payload = await queue.get()
+            await sem.acquire()
+            task = asyncio.create_task(_run(channel, payload))
+            running.add(task)
+            task.add_done_callback(running.discard)
     finally:
-        db.close()
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+def _accept_webhook(channel: str, payload: dict, background_tasks: BackgroundTasks):
+    """Queue a webhook for the consumer; if the queue is full or closed, run it as a background task."""
+    global _ingress_queue, _ingress_task
+    if _ingress_closed:
+        background_tasks.add_task(process_incoming_message, channel, payload)
+        return
+    if _ingress_queue is None:
+        _ingress_queue = asyncio.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+    if _ingress_task is None or _ingress_task.done():
+        _ingress_task = asyncio.create_task(_consume_webhooks(_ingress_queue))
+    try:
+        _ingress_queue.put_nowait((channel, payload))
+    except asyncio.QueueFull:
+        background_tasks.add_task(process_incoming_message, channel, payload)
 
 
 @router.post("/email")
 async def email_webhook(request: Request, background_tasks: BackgroundTasks):
-    payload = await request.json()
-    background_tasks.add_task(process_incoming_message, "email", payload)
+    payload = orjson.loads(await request.body())
+    _accept_webhook("email", payload, background_tasks)
     return {"status": "accepted"}
 
 
 @router.post("/slack")
 async def slack_webhook(request: Request, background_tasks: BackgroundTasks):
-    payload = await request.json()
-    background_tasks.add_task(process_incoming_message, "slack", payload)
+    payload = orjson.loads(await request.body())
+    _accept_webhook("slack", payload, background_tasks)
     return {"status": "accepted"}
 
 
 @router.post("/teams")
 async def teams_webhook(request: Request, background_tasks: BackgroundTasks):
-    payload = await request.json()
-    background_tasks.add_task(process_incoming_message, "teams", payload)
+    payload = orjson.loads(await request.body())
+    _accept_webhook("teams", payload, background_tasks)
     return {"status": "accepted"}
 
 
 @router.post("/calendar")
 async def calendar_webhook(request: Request, background_tasks: BackgroundTasks):
-    payload = await request.json()
+    payload = orjson.loads(await request.body())
     # Calendar events go to scheduling agent, not message pipeline
     logger.info(f"Calendar event received: {payload.get('event_type', 'unknown')}")
     return {"status": "accepted"}